@@ -56,10 +56,11 @@ class BlueskyScraper:
         try:
             codepoints = "-".join(f"{ord(c):x}" for c in emoji_char)
             emoji_url = f"https://raw.githubusercontent.com/twitter/twemoji/master/assets/72x72/{codepoints}.png"
-            response = requests.get(emoji_url)
-            response.raise_for_status()
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
+            with requests.get(emoji_url, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                with open(save_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
             logger.info(f"Emoji descargado: {emoji_char} -> {save_path}")
         except Exception as e:
             logger.error(f"Error al descargar emoji {emoji_char}: {e}")
@@ -81,10 +82,11 @@ class BlueskyScraper:
         if not url:
             return
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            with open(path, 'wb') as f:
-                f.write(response.content)
+            with requests.get(url, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                with open(path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
             logger.info(f"✅ Imagen descargada: {url} -> {path}")
         except Exception as e:
             logger.error(f"❌ Error al descargar {url}: {e}")
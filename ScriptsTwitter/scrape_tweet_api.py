@@ -6,15 +6,29 @@ import logging
 import argparse
 import subprocess
 import shutil
-from typing import Optional, Dict, List, Tuple, Any
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Iterator, List, Tuple, Any
 
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from yt_dlp import YoutubeDL
 from langdetect import detect
+try:
+    from ftlangdetect import detect as ft_detect  # type: ignore
+except Exception:  # pragma: no cover
+    ft_detect = None
 from deep_translator import GoogleTranslator
 import emoji
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
 # Configuración de Logging
 logging.basicConfig(
     level=logging.INFO,
@@ -28,7 +42,91 @@ logger = logging.getLogger(__name__)
 # Cargar variables de entorno
 load_dotenv()
 
+# Caché de traducciones en disco (clave: hash del texto original). Vive junto a los
+# scripts, no en la carpeta de descargas (share SMB), y es una sola por proceso:
+# todas las instancias del scraper comparten el mismo diccionario
+TRANSLATION_CACHE_FILE = ".trans_cache.json"
+TRANSLATION_CACHE_PATH = os.getenv(
+    "TRANSLATION_CACHE_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), TRANSLATION_CACHE_FILE)
+)
+TRANSLATION_CACHE_TTL_SECONDS = 14 * 24 * 3600
+# Límite de caracteres por petición de GoogleTranslator; los textos pendientes se
+# unen con TRANSLATION_SEPARATOR en peticiones de como mucho ese tamaño
+TRANSLATION_MAX_CHARS = 5000
+TRANSLATION_SEPARATOR = "\n\u00a7\u00a7\u00a7\n"
+_translation_cache_lock = threading.Lock()
+_translation_cache: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def _read_translation_cache_file() -> Dict[str, Dict[str, Any]]:
+    """Lee la caché de disco descartando entradas caducadas o mal formadas."""
+    try:
+        with open(TRANSLATION_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    now = time.time()
+    return {
+        key: entry for key, entry in cache.items()
+        if isinstance(entry, dict) and now - entry.get("ts", 0) < TRANSLATION_CACHE_TTL_SECONDS
+    }
+
+
+def _shared_translation_cache() -> Dict[str, Dict[str, Any]]:
+    """Caché del proceso; se carga de disco la primera vez que se pide."""
+    global _translation_cache
+    with _translation_cache_lock:
+        if _translation_cache is None:
+            _translation_cache = _read_translation_cache_file()
+        return _translation_cache
+
+# Campos solicitados a la API v2 (comunes a la petición individual y por lotes)
+TWEET_API_PARAMS = {
+    "expansions": "author_id,attachments.media_keys",
+    "tweet.fields": "created_at,text,note_tweet",
+    "user.fields": "name,username,profile_image_url",
+    "media.fields": "url,type"
+}
+TWEET_BATCH_SIZE = 100
+
+# Copia local opcional de Twemoji (PNG 72x72 nombrados por codepoints, p.ej. 1f600.png).
+# Si existe, los emojis se copian desde disco y solo se descargan los que falten.
+TWEMOJI_DIR = os.getenv(
+    "TWEMOJI_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "twemoji", "72x72")
+)
+
+# Expresiones regulares precompiladas
+_TWEET_ID_RE = re.compile(r'/status/(\d+)')
+_MENTIONS_RE = re.compile(r'^(?:@\w+\s*)+')
+_TCO_RE = re.compile(r'https://t\.co/\S+')
+_PROFILE_RESIZE_RE = re.compile(r'_normal(\.\w+)$')
+
+# Prefiltro de emojis: secuencias de caracteres de los bloques Unicode con emojis
+# (más ZWJ, FE0F, keycaps, modificadores y tags). Es un superconjunto de
+# emoji.EMOJI_DATA, así que emoji.emoji_list solo tiene que analizar estos tramos.
+_EMOJI_CANDIDATE_RE = re.compile(
+    '(?:[#*0-9]\uFE0F?\u20E3'
+    '|[\u00A9\u00AE\u203C\u2049\u2122\u2139\u2190-\u21FF\u2300-\u27BF\u2934\u2935'
+    '\u24C2\u2B00-\u2BFF\u3030\u303D\u3297\u3299\U0001F000-\U0001FAFF'
+    '\u200D\uFE0F\u20E3\U000E0020-\U000E007F])+'
+)
+
+# Atajo para textos cortos en ASCII (donde los detectores fallan más): palabras
+# frecuentes que solo usa el español (no el portugués, italiano, catalán o francés).
+# Si aparecen varias distintas se evita el detector
+_SPANISH_HINT_RE = re.compile(r'\b(los|las|muy|hay|pero|usted|ustedes|nosotros|ellos)\b', re.IGNORECASE)
+_SPANISH_HINT_MAX_CHARS = 280
+
 class TweetScraper:
+    max_download_workers = 16
+    _ffmpeg_checked = False
+    _ffmpeg_path: Optional[str] = None
+    _nvenc_available: Optional[bool] = None
+
     def __init__(self, output_dir: str):
         self.output_dir = output_dir
         self.temp_folder_video = os.path.join(self.output_dir, "TempVideo")
@@ -40,8 +138,20 @@ class TweetScraper:
         if not self.bearer_token:
             raise ValueError("❌ Error: TWITTER_BEARER_TOKEN no encontrado en variables de entorno.")
 
+        self.session = self._build_requests_session()
         self._setup_directories()
 
+        self._trans_cache = _shared_translation_cache()
+
+    def _build_requests_session(self) -> requests.Session:
+        """Sesión HTTP compartida (keep-alive) para API, imágenes y emojis."""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"User-Agent": "TweetScraper/1.0"})
+        return session
+
     def _setup_directories(self):
         """Crea los directorios necesarios si no existen."""
         os.makedirs(self.output_dir, exist_ok=True)
@@ -50,44 +160,214 @@ class TweetScraper:
 
     def extract_tweet_id(self, tweet_url: str) -> Optional[str]:
         """Extrae el ID del tuit desde la URL."""
-        match = re.search(r'/status/(\d+)', tweet_url)
+        match = _TWEET_ID_RE.search(tweet_url)
         return match.group(1) if match else None
 
     def get_tweet_data(self, tweet_id: str) -> Dict[str, Any]:
         """Obtiene los datos del tuit desde la API de Twitter v2."""
         url = f"https://api.twitter.com/2/tweets/{tweet_id}"
-        params = {
-            "expansions": "author_id,attachments.media_keys",
-            "tweet.fields": "created_at,text,note_tweet",
-            "user.fields": "name,username,profile_image_url",
-            "media.fields": "url,type"
-        }
         headers = {
             "Authorization": f"Bearer {self.bearer_token}"
         }
-        response = requests.get(url, params=params, headers=headers)
+        response = self.session.get(url, params=TWEET_API_PARAMS, headers=headers)
         if response.status_code != 200:
             raise Exception(f"Error {response.status_code}: {response.text}")
         return response.json()
 
-    def traducir_texto(self, texto: str) -> Tuple[str, str]:
-        """Traduce el texto al español si detecta otro idioma."""
+    def get_tweets_batch(self, ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Obtiene varios tuits con /2/tweets?ids=... (hasta 100 por petición).
+        Devuelve tweet_id -> JSON con la misma forma que get_tweet_data.
+        """
+        headers = {"Authorization": f"Bearer {self.bearer_token}"}
+        results: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(ids), TWEET_BATCH_SIZE):
+            chunk = ids[start:start + TWEET_BATCH_SIZE]
+            params = dict(TWEET_API_PARAMS, ids=",".join(chunk))
+            response = self.session.get("https://api.twitter.com/2/tweets", params=params, headers=headers)
+            if response.status_code != 200:
+                raise Exception(f"Error {response.status_code}: {response.text}")
+            payload = response.json()
+            includes = payload.get("includes", {})
+            users = {u.get("id"): u for u in includes.get("users", [])}
+            media = {m.get("media_key"): m for m in includes.get("media", [])}
+
+            for tweet in payload.get("data", []):
+                media_keys = (tweet.get("attachments") or {}).get("media_keys", [])
+                results[tweet["id"]] = {
+                    "data": tweet,
+                    "includes": {
+                        "users": [users.get(tweet.get("author_id"), {})],
+                        "media": [media[k] for k in media_keys if k in media]
+                    }
+                }
+            for error in payload.get("errors", []):
+                logger.warning(f"⚠️ Tuit no disponible {error.get('value', '')}: {error.get('detail', error)}")
+        return results
+
+    def _save_translation_cache(self):
+        """
+        Escribe la caché de forma atómica (tmp + os.replace). Antes se mezcla con lo
+        que haya en disco (otro proceso, p.ej. el script por línea de comandos) para
+        no perder sus entradas; ante la misma clave gana la más reciente.
+        """
+        tmp_path = f"{TRANSLATION_CACHE_PATH}.{os.getpid()}.tmp"
         try:
-            idioma_detectado = detect(texto)
+            with _translation_cache_lock:
+                for key, entry in _read_translation_cache_file().items():
+                    current = self._trans_cache.get(key)
+                    if current is None or current.get("ts", 0) < entry.get("ts", 0):
+                        self._trans_cache[key] = entry
+                # dict.copy es atómico: otros hilos pueden seguir añadiendo traducciones
+                snapshot = self._trans_cache.copy()
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(snapshot, f, ensure_ascii=False)
+                os.replace(tmp_path, TRANSLATION_CACHE_PATH)
+        except OSError as e:
+            logger.warning(f"⚠️ No se pudo guardar la caché de traducciones: {e}")
+
+    @staticmethod
+    def _translation_key(texto: str) -> str:
+        return hashlib.blake2b(texto.encode("utf-8"), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _parece_espanol(texto: str) -> bool:
+        """Atajo heurístico: texto corto en ASCII con al menos dos marcadores exclusivos del español."""
+        if len(texto) > _SPANISH_HINT_MAX_CHARS or not texto.isascii():
+            return False
+        return len({m.lower() for m in _SPANISH_HINT_RE.findall(texto)}) >= 2
+
+    @staticmethod
+    def _detectar_idioma(texto: str) -> str:
+        """Detecta el idioma; usa fastText si está instalado y langdetect como respaldo."""
+        if ft_detect is not None:
+            try:
+                # fastText no admite saltos de línea en la entrada
+                return ft_detect(texto.replace("\n", " "))["lang"]
+            except Exception as e:
+                logger.debug(f"fastText falló, usando langdetect: {e}")
+        return detect(texto)
+
+    def _cached_translation(self, key: str) -> Optional[Dict[str, Any]]:
+        cached = self._trans_cache.get(key)
+        if cached and time.time() - cached.get("ts", 0) < TRANSLATION_CACHE_TTL_SECONDS:
+            return cached
+        return None
+
+    def traducir_textos(self, textos: List[str]) -> List[Tuple[str, str]]:
+        """
+        Traduce varios textos al español reutilizando la caché.
+        Los textos no cacheados en otro idioma se unen en peticiones de hasta
+        TRANSLATION_MAX_CHARS (translate_batch hace una petición por texto)
+        y la caché se guarda una sola vez al final.
+        """
+        results: List[Tuple[str, str]] = [(t.strip(), t.strip()) for t in textos]
+        pending: List[Tuple[int, str, str, str]] = []  # (posición, clave, texto, idioma)
+        dirty = False
+
+        for idx, texto in enumerate(textos):
+            if not texto.strip():
+                continue
+            key = self._translation_key(texto)
+            cached = self._cached_translation(key)
+            if cached:
+                logger.info(f"🌍 Traducción en caché (idioma: {cached.get('lang')})")
+                results[idx] = (texto.strip(), cached.get("translated", texto.strip()))
+                continue
+            if self._parece_espanol(texto):
+                # Veredicto heurístico: no se guarda en la caché para no fijar un posible error
+                logger.info("🌍 Idioma detectado: es (heurística)")
+                continue
+            try:
+                idioma_detectado = self._detectar_idioma(texto)
+            except Exception as e:
+                logger.error(f"❌ Error al detectar idioma: {e}")
+                continue
             logger.info(f"🌍 Idioma detectado: {idioma_detectado}")
-
-            if idioma_detectado != "es":
-                traducido = GoogleTranslator(source='auto', target='es').translate(texto)
-                return texto.strip(), traducido.strip()
+            if idioma_detectado == "es":
+                self._trans_cache[key] = {"lang": "es", "translated": texto.strip(), "ts": time.time()}
+                dirty = True
             else:
-                return texto.strip(), texto.strip()
-        except Exception as e:
-            logger.error(f"❌ Error al traducir: {e}")
-            return texto.strip(), texto.strip()
+                pending.append((idx, key, texto, idioma_detectado))
+
+        if pending:
+            translator = GoogleTranslator(source='auto', target='es')
+            for batch in self._translation_batches(pending):
+                translated = self._translate_joined(translator, [item[2] for item in batch])
+                for (idx, key, texto, idioma), traducido in zip(batch, translated):
+                    if traducido is None:
+                        continue
+                    traducido = (traducido or texto).strip()
+                    results[idx] = (texto.strip(), traducido)
+                    self._trans_cache[key] = {"lang": idioma, "translated": traducido, "ts": time.time()}
+                    dirty = True
+
+        if dirty:
+            self._save_translation_cache()
+        return results
+
+    @staticmethod
+    def _translation_batches(pending: List[Tuple[int, str, str, str]]) -> Iterator[List[Tuple[int, str, str, str]]]:
+        """Agrupa los pendientes para que cada texto unido quepa en TRANSLATION_MAX_CHARS."""
+        batch: List[Tuple[int, str, str, str]] = []
+        size = 0
+        for item in pending:
+            length = len(item[2]) + (len(TRANSLATION_SEPARATOR) if batch else 0)
+            if batch and size + length > TRANSLATION_MAX_CHARS:
+                yield batch
+                batch, size = [], 0
+                length = len(item[2])
+            batch.append(item)
+            size += length
+        if batch:
+            yield batch
+
+    @staticmethod
+    def _translate_joined(translator: Any, textos: List[str]) -> List[Optional[str]]:
+        """
+        Traduce varios textos con una sola petición. Si la respuesta no se puede
+        volver a partir en tantos trozos como textos, se traducen uno a uno.
+        None marca los textos que no se pudieron traducir.
+        """
+        if len(textos) > 1:
+            try:
+                joined = translator.translate(TRANSLATION_SEPARATOR.join(textos)) or ""
+                parts = joined.split(TRANSLATION_SEPARATOR.strip())
+                if len(parts) == len(textos):
+                    return [part.strip() for part in parts]
+                logger.debug("La traducción unida no conserva los separadores; se traduce por texto")
+            except Exception as e:
+                logger.error(f"❌ Error al traducir: {e}")
+                return [None] * len(textos)
+        translated: List[Optional[str]] = []
+        for texto in textos:
+            try:
+                translated.append(translator.translate(texto))
+            except Exception as e:
+                logger.error(f"❌ Error al traducir: {e}")
+                translated.append(None)
+        return translated
+
+    def traducir_texto(self, texto: str) -> Tuple[str, str]:
+        """Traduce el texto al español si detecta otro idioma (con caché en disco)."""
+        return self.traducir_textos([texto])[0]
+
+    @classmethod
+    def tweet_text(cls, json_data: Dict[str, Any]) -> str:
+        """Texto limpio del tuit (note_tweet completo si existe)."""
+        tweet = json_data.get("data", {})
+        note_tweet = tweet.get("note_tweet", {})
+        full_text = note_tweet.get("text") if isinstance(note_tweet, dict) else ""
+        return cls.clean_tweet_text((full_text or tweet.get("text", "")).strip())
+
+    @staticmethod
+    def clean_tweet_text(text: str) -> str:
+        """Limpiezas básicas: menciones iniciales de respuesta y enlaces t.co."""
+        text = _MENTIONS_RE.sub('', text.strip()).strip()
+        return _TCO_RE.sub('', text).strip()
 
     def extract_relevant_data(self, json_data: Dict[str, Any]) -> Dict[str, Any]:
         """Procesa el JSON de la API y extrae la información relevante."""
-        tweet = json_data.get("data", {})
         includes = json_data.get("includes", {})
         user = includes.get("users", [{}])[0]
 
@@ -103,16 +383,9 @@ class TweetScraper:
 
         profile_image_url = user.get("profile_image_url", "")
         # Obtener imagen de perfil en mayor resolución
-        profile_image_hd = re.sub(r'_normal(\.\w+)$', r'_400x400\1', profile_image_url)
+        profile_image_hd = _PROFILE_RESIZE_RE.sub(r'_400x400\1', profile_image_url)
         
-        note_tweet = tweet.get("note_tweet", {})
-        full_text = note_tweet.get("text") if isinstance(note_tweet, dict) else ""
-        text = (full_text or tweet.get("text", "")).strip()
-        # Limpiezas básicas de texto
-        text = re.sub(r'^(?:@\w+\s*)+', '', text).strip()
-        text = re.sub(r'https://t\.co/\S+', '', text).strip()
-        
-        text, texto_traducido = self.traducir_texto(text)
+        text, texto_traducido = self.traducir_texto(self.tweet_text(json_data))
         
         return {
             "text": text,
@@ -125,22 +398,42 @@ class TweetScraper:
         }
 
     def save_to_json(self, data: Dict[str, Any], path: str):
-        """Guarda los datos en un archivo JSON."""
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-
-    def download_image(self, url: str, path: str):
-        """Descarga una imagen desde una URL."""
+        """Guarda los datos en un archivo JSON de forma atómica (tmp + os.replace)."""
+        tmp_path = path + ".tmp"
+        if orjson is not None:
+            with open(tmp_path, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+    def _download(self, url: str, path: str) -> bool:
+        """Descarga una URL a disco en bloques usando la sesión compartida."""
         if not url:
-            return
+            return False
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            with open(path, 'wb') as f:
-                f.write(response.content)
-            logger.info(f"✅ Imagen descargada: {url} -> {path}")
+            with self.session.get(url, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                with open(path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+            logger.info(f"✅ Descargado: {url} -> {path}")
+            return True
         except Exception as e:
             logger.error(f"❌ Error al descargar {url}: {e}")
+            return False
+
+    def _download_many(self, tasks: List[Tuple[str, str]]):
+        """Descarga en paralelo una lista de (url, ruta) independientes."""
+        if not tasks:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_download_workers, len(tasks))) as executor:
+            list(executor.map(lambda task: self._download(task[0], task[1]), tasks))
+
+    def download_image(self, url: str, path: str):
+        """Descarga una imagen desde una URL."""
+        self._download(url, path)
 
     def download_video_or_gif(self, tweet_url: str):
         """Descarga el video o GIF usando yt-dlp."""
@@ -157,6 +450,18 @@ class TweetScraper:
         except Exception as e:
             logger.error(f"❌ Error al descargar el video: {e}")
 
+    def _find_downloaded_video(self) -> Optional[str]:
+        """Localiza el VideoOriginal.* que ha dejado yt-dlp en la carpeta temporal."""
+        expected = os.path.join(self.temp_folder_video, "VideoOriginal.mp4")
+        if os.path.isfile(expected):
+            return expected
+        # yt-dlp puede guardar con otras extensiones si no llega a fusionar a mp4
+        try:
+            with os.scandir(self.temp_folder_video) as it:
+                return next((e.path for e in it if e.name.startswith("VideoOriginal")), None)
+        except OSError:
+            return None
+
     def _parse_fps(self, value: str) -> Optional[float]:
         """Convierte un valor de fps tipo '30000/1001' a float."""
         if not value:
@@ -199,25 +504,77 @@ class TweetScraper:
             logger.debug(f"No se pudo analizar video con ffprobe ({input_path}): {e}")
             return None, ""
 
-    def convertir_a_25fps(self, input_path: str, output_path: str):
+    @classmethod
+    def _get_ffmpeg_path(cls) -> str:
+        """Resuelve la ruta absoluta de ffmpeg una sola vez por proceso."""
+        if not cls._ffmpeg_checked:
+            cls._ffmpeg_path = shutil.which("ffmpeg")
+            cls._ffmpeg_checked = True
+        if not cls._ffmpeg_path:
+            raise FileNotFoundError("ffmpeg")
+        return cls._ffmpeg_path
+
+    @classmethod
+    def _probe_nvenc(cls) -> bool:
+        """
+        Comprueba una sola vez por proceso si ffmpeg puede codificar con NVENC,
+        con un fotograma sintético: el fallo de un video concreto no dice nada de la GPU.
+        """
+        if cls._nvenc_available is None:
+            try:
+                subprocess.run([
+                    cls._get_ffmpeg_path(), "-f", "lavfi", "-i", "nullsrc=s=256x256:d=1",
+                    "-c:v", "h264_nvenc", "-frames:v", "1", "-f", "null", "-"
+                ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                cls._nvenc_available = True
+            except subprocess.CalledProcessError:
+                logger.info("ℹ️ NVENC no disponible; se usará libx264.")
+                cls._nvenc_available = False
+        return cls._nvenc_available
+
+    def _encode_nvenc(self, input_path: str, output_path: str) -> bool:
+        """Intenta recodificar a 25 fps con NVENC; si falla, solo ese video pasa a libx264."""
+        if not self._probe_nvenc():
+            return False
+        try:
+            # El audio se trata igual que en la ruta libx264 (códec por defecto del MP4)
+            subprocess.run([
+                self._get_ffmpeg_path(), "-hwaccel", "cuda", "-i", input_path,
+                "-vf", "fps=25", "-c:v", "h264_nvenc", "-preset", "p4",
+                "-y", output_path
+            ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return True
+        except subprocess.CalledProcessError as e:
+            logger.debug(f"NVENC falló para {input_path}: {e}")
+            return False
+
+    def convertir_a_25fps(self, input_path: str, output_path: str, consume_input: bool = False):
         """
         Convierte el video a 25 fps usando ffmpeg solo si es necesario.
-        Si ya está en MP4 a 25 fps, copia el archivo sin recodificar.
+        Si ya está en MP4 a 25 fps, copia el archivo sin recodificar
+        (o lo mueve si consume_input=True, evitando reescribir los bytes).
+        Si hay GPU NVIDIA se recodifica con NVENC; si no, con libx264.
         """
         try:
-            # Verificar si ffmpeg está instalado
-            subprocess.run(["ffmpeg", "-version"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+            ffmpeg_path = self._get_ffmpeg_path()
 
             fps, format_name = self._probe_video(input_path)
             is_mp4 = input_path.lower().endswith(".mp4") or ("mp4" in (format_name or "").lower())
             if fps is not None and abs(fps - 25.0) < 0.05 and is_mp4:
                 if os.path.abspath(input_path) != os.path.abspath(output_path):
-                    shutil.copy2(input_path, output_path)
+                    if consume_input:
+                        os.replace(input_path, output_path)
+                    else:
+                        shutil.copy2(input_path, output_path)
                 logger.info("ℹ️ Video ya está en MP4 a 25 fps; se omite conversión.")
                 return True
 
+            if self._encode_nvenc(input_path, output_path):
+                logger.info("✅ Video convertido a 25 fps (NVENC).")
+                return True
+
             subprocess.run([
-                "ffmpeg", "-i", input_path, "-r", "25", "-y", output_path
+                ffmpeg_path, "-i", input_path, "-r", "25", "-y", output_path
             ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             logger.info("✅ Video convertido a 25 fps.")
             return True
@@ -228,28 +585,134 @@ class TweetScraper:
             logger.error(f"❌ Error al convertir video a 25 fps: {e}")
             return False
 
-    def extract_emojis(self, text: str) -> List[str]:
-        """Extrae emojis únicos del texto."""
-        return [entry['emoji'] for entry in emoji.emoji_list(text)]
+    def _collect_emojis(self, *texts: str) -> List[str]:
+        """Extrae emojis únicos (en orden de aparición) de uno o varios textos."""
+        spans: List[str] = []
+        for text in texts:
+            spans.extend(_EMOJI_CANDIDATE_RE.findall(text or ""))
+        if not spans:
+            return []
+        seen = set()
+        emojis: List[str] = []
+        for entry in emoji.emoji_list(" ".join(spans)):
+            char = entry['emoji']
+            if char not in seen:
+                seen.add(char)
+                emojis.append(char)
+        return emojis
+
+    @staticmethod
+    def emoji_url(emoji_char: str) -> str:
+        """Construye la URL de Twemoji (72x72) para un emoji."""
+        codepoints = "-".join(f"{ord(c):x}" for c in emoji_char)
+        return f"https://raw.githubusercontent.com/twitter/twemoji/master/assets/72x72/{codepoints}.png"
+
+    @staticmethod
+    def copy_local_emoji(emoji_char: str, save_path: str) -> bool:
+        """Copia el PNG del emoji desde TWEMOJI_DIR si está disponible localmente."""
+        if not os.path.isdir(TWEMOJI_DIR):
+            return False
+        codepoints = [f"{ord(c):x}" for c in emoji_char]
+        # Twemoji omite el selector de variación FE0F en muchos nombres de archivo
+        candidates = ["-".join(codepoints), "-".join(cp for cp in codepoints if cp != "fe0f")]
+        for name in candidates:
+            local_path = os.path.join(TWEMOJI_DIR, f"{name}.png")
+            if os.path.isfile(local_path):
+                try:
+                    shutil.copyfile(local_path, save_path)
+                    return True
+                except OSError as e:
+                    logger.debug(f"No se pudo copiar {local_path}: {e}")
+        return False
 
     def download_emoji(self, emoji_char: str, save_path: str):
-        """Descarga la imagen de un emoji desde Twemoji."""
-        try:
-            codepoints = "-".join(f"{ord(c):x}" for c in emoji_char)
-            emoji_url = f"https://raw.githubusercontent.com/twitter/twemoji/master/assets/72x72/{codepoints}.png"
-            response = requests.get(emoji_url)
-            response.raise_for_status()
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
-            logger.info(f"✅ Emoji descargado: {emoji_char} → {save_path}")
-        except Exception as e:
-            logger.error(f"❌ Error al descargar {emoji_char}: {e}")
+        """Obtiene la imagen de un emoji (copia local de Twemoji o descarga)."""
+        if not self.copy_local_emoji(emoji_char, save_path):
+            self._download(self.emoji_url(emoji_char), save_path)
+
+    @staticmethod
+    def compile_emoji_pattern(emoji_map: Dict[str, str]) -> Optional["re.Pattern[str]"]:
+        """Compila una única alternancia con los emojis (los más largos primero, por secuencias ZWJ)."""
+        if not emoji_map:
+            return None
+        return re.compile("|".join(re.escape(k) for k in sorted(emoji_map, key=len, reverse=True)))
+
+    def replace_emojis_with_oemj(self, text: str, emoji_map: Dict[str, str],
+                                 pattern: Optional["re.Pattern[str]"] = None) -> str:
+        """Reemplaza emojis en el texto con etiquetas personalizadas en una sola pasada."""
+        if not text or not emoji_map:
+            return text
+        if pattern is None:
+            pattern = self.compile_emoji_pattern(emoji_map)
+        return pattern.sub(lambda m: emoji_map[m[0]], text)
+
+    def _use_output_dir(self, output_dir: str):
+        """Redirige todas las rutas de salida de la instancia a output_dir."""
+        self.output_dir = output_dir
+        self.temp_folder_video = os.path.join(output_dir, "TempVideo")
+        self.output_folder_images = output_dir
+        self.output_folder_media = output_dir
+        self.emojis_dir = os.path.join(output_dir, "Emojis")
+        self._setup_directories()
 
-    def replace_emojis_with_oemj(self, text: str, emoji_map: Dict[str, str]) -> str:
-        """Reemplaza emojis en el texto con etiquetas personalizadas."""
-        for emoji_char, replacement in emoji_map.items():
-            text = text.replace(emoji_char, replacement)
-        return text
+    def _process_tweet(self, tweet_url: str, json_data: Dict[str, Any]):
+        """Descarga medios/emojis y guarda el JSON de un tuit ya obtenido de la API."""
+        data = self.extract_relevant_data(json_data)
+
+        # Manejo de Video
+        video_original_path = os.path.join(self.temp_folder_video, "VideoOriginal.mp4")
+        video_final_path = os.path.join(self.output_folder_media, "VideoPost.mp4")
+
+        # Limpieza previa
+        for path in [video_original_path, video_final_path]:
+            if os.path.exists(path):
+                try:
+                    os.remove(path)
+                    logger.info(f"🗑️ Archivo anterior eliminado: {path}")
+                except Exception as e:
+                    logger.error(f"❌ No se pudo eliminar {path}: {e}")
+
+        if data.get("has_video"):
+            self.download_video_or_gif(tweet_url)
+            full_downloaded_path = self._find_downloaded_video()
+            
+            if full_downloaded_path:
+                if self.convertir_a_25fps(full_downloaded_path, video_final_path, consume_input=True):
+                    logger.info(f"✅ Video listo en {video_final_path}")
+                else:
+                    logger.warning("⚠️ No se pudo preparar el video final a 25 fps.")
+            else:
+                logger.warning("⚠️ No se encontró el video descargado.")
+        else:
+            logger.info("ℹ️ El tuit no contiene video ni GIF.")
+
+        # Manejo de Emojis
+        emojis = self._collect_emojis(data["text"], data["name"])
+
+        emoji_map = {emoji: f"\\oemj {i+1};" for i, emoji in enumerate(emojis)}
+
+        # Imágenes y emojis son descargas independientes: se lanzan en paralelo
+        downloads = []
+        if data.get("profile_image"):
+            downloads.append((data["profile_image"], os.path.join(self.output_folder_images, "FotoPerfil.jpg")))
+        if data.get("tweet_image"):
+            downloads.append((data["tweet_image"], os.path.join(self.output_folder_images, "FotoPost.jpg")))
+        for idx, emoji_char in enumerate(emojis, start=1):
+            filepath = os.path.join(self.emojis_dir, f"emoji{idx}.png")
+            if not self.copy_local_emoji(emoji_char, filepath):
+                downloads.append((self.emoji_url(emoji_char), filepath))
+        self._download_many(downloads)
+        logger.info("✅ Imágenes y emojis descargados si estaban disponibles.")
+
+        emoji_pattern = self.compile_emoji_pattern(emoji_map)
+        data["text"] = self.replace_emojis_with_oemj(data["text"], emoji_map, emoji_pattern)
+        data["name"] = self.replace_emojis_with_oemj(data["name"], emoji_map, emoji_pattern)
+        data["text_traducido"] = self.replace_emojis_with_oemj(data["text_traducido"], emoji_map, emoji_pattern)
+
+        # Guardar JSON
+        json_path = os.path.join(self.output_dir, "tweet_api.json")
+        self.save_to_json(data, json_path)
+        logger.info(f"✅ JSON guardado: {json_path}")
 
     def run(self, tweet_url: str):
         """Ejecuta el flujo principal de scraping."""
@@ -260,72 +723,50 @@ class TweetScraper:
 
         try:
             json_data = self.get_tweet_data(tweet_id)
-            data = self.extract_relevant_data(json_data)
-
-            # Descargar imágenes
-            if data.get("profile_image"):
-                self.download_image(data["profile_image"], os.path.join(self.output_folder_images, "FotoPerfil.jpg"))
-            if data.get("tweet_image"):
-                self.download_image(data["tweet_image"], os.path.join(self.output_folder_images, "FotoPost.jpg"))
-            logger.info("✅ Imágenes descargadas si estaban disponibles.")
-
-            # Manejo de Video
-            video_original_path = os.path.join(self.temp_folder_video, "VideoOriginal.mp4")
-            video_final_path = os.path.join(self.output_folder_media, "VideoPost.mp4")
-
-            # Limpieza previa
-            for path in [video_original_path, video_final_path]:
-                if os.path.exists(path):
-                    try:
-                        os.remove(path)
-                        logger.info(f"🗑️ Archivo anterior eliminado: {path}")
-                    except Exception as e:
-                        logger.error(f"❌ No se pudo eliminar {path}: {e}")
-
-            if data.get("has_video"):
-                self.download_video_or_gif(tweet_url)
-                # yt-dlp puede guardar con otras extensiones, buscamos el archivo
-                downloaded_files = os.listdir(self.temp_folder_video)
-                downloaded_video = next((f for f in downloaded_files if f.startswith("VideoOriginal")), None)
-                
-                if downloaded_video:
-                    full_downloaded_path = os.path.join(self.temp_folder_video, downloaded_video)
-                    if self.convertir_a_25fps(full_downloaded_path, video_final_path):
-                        logger.info(f"✅ Video listo en {video_final_path}")
-                    else:
-                        logger.warning("⚠️ No se pudo preparar el video final a 25 fps.")
-                else:
-                    logger.warning("⚠️ No se encontró el video descargado.")
-            else:
-                logger.info("ℹ️ El tuit no contiene video ni GIF.")
-
-            # Manejo de Emojis
-            text_emojis = self.extract_emojis(data["text"])
-            name_emojis = self.extract_emojis(data["name"])
-            emojis = list(dict.fromkeys(text_emojis + name_emojis))
-
-            emoji_map = {emoji: f"\\oemj {i+1};" for i, emoji in enumerate(emojis)}
-
-            for idx, emoji_char in enumerate(emojis, start=1):
-                filename = f"emoji{idx}.png"
-                filepath = os.path.join(self.emojis_dir, filename)
-                self.download_emoji(emoji_char, filepath)
-
-            data["text"] = self.replace_emojis_with_oemj(data["text"], emoji_map)
-            data["name"] = self.replace_emojis_with_oemj(data["name"], emoji_map)
-            data["text_traducido"] = self.replace_emojis_with_oemj(data["text_traducido"], emoji_map)
+            self._process_tweet(tweet_url, json_data)
+        except Exception as e:
+            logger.error(f"❌ Error al procesar el tuit: {e}", exc_info=True)
+        finally:
+            self.session.close()
 
-            # Guardar JSON
-            json_path = os.path.join(self.output_dir, "tweet_api.json")
-            self.save_to_json(data, json_path)
-            logger.info(f"✅ JSON guardado: {json_path}")
+    def run_many(self, tweet_urls: List[str]):
+        """
+        Procesa varios tuits pidiendo sus datos a la API en una sola petición por lotes.
+        Cada tuit se guarda en su propia subcarpeta <output_dir>/<tweet_id>.
+        """
+        base_dir = self.output_dir
+        ids_by_url = {url: self.extract_tweet_id(url) for url in tweet_urls}
+        for url, tweet_id in ids_by_url.items():
+            if not tweet_id:
+                logger.error(f"❌ No se pudo extraer el ID del tuit: {url}")
 
+        try:
+            unique_ids = list(dict.fromkeys(i for i in ids_by_url.values() if i))
+            batch = self.get_tweets_batch(unique_ids) if unique_ids else {}
+            # Todas las traducciones de una vez: después cada tuit las toma de la caché
+            # y la caché en disco se escribe una sola vez
+            if batch:
+                self.traducir_textos([self.tweet_text(json_data) for json_data in batch.values()])
+            for url, tweet_id in ids_by_url.items():
+                if not tweet_id:
+                    continue
+                if tweet_id not in batch:
+                    logger.error(f"❌ La API no devolvió datos para {url}")
+                    continue
+                try:
+                    self._use_output_dir(os.path.join(base_dir, tweet_id))
+                    self._process_tweet(url, batch[tweet_id])
+                except Exception as e:
+                    logger.error(f"❌ Error al procesar el tuit {url}: {e}", exc_info=True)
         except Exception as e:
-            logger.error(f"❌ Error al procesar el tuit: {e}", exc_info=True)
+            logger.error(f"❌ Error al obtener los tuits: {e}", exc_info=True)
+        finally:
+            self._use_output_dir(base_dir)
+            self.session.close()
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Scrape Tweet Data via API")
-    parser.add_argument("url", help="URL del tuit a procesar")
+    parser.add_argument("url", nargs="+", help="URL(s) del tuit a procesar; con varias, cada una va a <output>/<tweet_id>")
     parser.add_argument("--output", "-o", default=r"C:\TrabajoIPF\Pruebas", help="Directorio de salida (default: C:\TrabajoIPF\Pruebas)")
     
     args = parser.parse_args()
@@ -338,7 +779,10 @@ if __name__ == "__main__":
 
     try:
         scraper = TweetScraper(output_dir=args.output)
-        scraper.run(args.url)
+        if len(args.url) == 1:
+            scraper.run(args.url[0])
+        else:
+            scraper.run_many(args.url)
     except ValueError as e:
         logger.error(e)
         sys.exit(1)
@@ -104,10 +104,11 @@ class TruthSocialScraper:
         if not url:
             return
         try:
-            response = self.session.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            with open(path, 'wb') as f:
-                f.write(response.content)
+            with self.session.get(url, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                with open(path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
             logger.info(f"Imagen descargada: {url} -> {path}")
         except Exception as e:
             logger.error(f"Error al descargar {url}: {e}")
@@ -146,10 +147,11 @@ class TruthSocialScraper:
         try:
             codepoints = "-".join(f"{ord(c):x}" for c in emoji_char)
             emoji_url = f"https://raw.githubusercontent.com/twitter/twemoji/master/assets/72x72/{codepoints}.png"
-            response = self.session.get(emoji_url, timeout=self.timeout)
-            response.raise_for_status()
-            with open(save_path, 'wb') as f:
-                f.write(response.content)
+            with self.session.get(emoji_url, stream=True, timeout=self.timeout) as response:
+                response.raise_for_status()
+                with open(save_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
             logger.info(f"Emoji descargado: {emoji_char} -> {save_path}")
         except Exception as e:
             logger.error(f"Error al descargar emoji {emoji_char}: {e}")
@@ -35,7 +35,7 @@ if not exist "%DOWNLOAD_PATH%" (
 )
 
 echo ADVERTENCIA: Esto eliminara TODAS las carpetas de tweets descargados.
-echo El archivo index.csv y content_state.json tambien seran eliminados.
+echo Los archivos index.csv, content_state.json y content_state.log tambien seran eliminados.
 echo.
 set /p CONFIRM="¿Estas seguro? (S/N): "
 if /i not "%CONFIRM%"=="S" (
@@ -59,6 +59,17 @@ if exist "%DOWNLOAD_PATH%\content_state.json" (
     )
 )
 
+REM Eliminar el diario de estado (si no, se volveria a aplicar al arrancar)
+if exist "%DOWNLOAD_PATH%\content_state.log" (
+    echo Eliminando content_state.log...
+    del /f /q "%DOWNLOAD_PATH%\content_state.log" 2>nul
+    if exist "%DOWNLOAD_PATH%\content_state.log" (
+        echo   [!] No se pudo eliminar content_state.log
+    ) else (
+        echo   [OK] content_state.log eliminado
+    )
+)
+
 REM Eliminar index.csv
 if exist "%DOWNLOAD_PATH%\index.csv" (
     echo Eliminando index.csv...
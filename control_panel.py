@@ -87,15 +87,16 @@ def save_config(config):
     with open(config_path, 'w', encoding='utf-8') as f:
         json.dump(_normalize_config(current), f, indent=4, ensure_ascii=False)
 
-def get_profiles_dir():
-    config = load_config()
+def get_profiles_dir(config=None):
+    if config is None:
+        config = load_config()
     profiles_dir = config.get("profiles_dir", "profiles")
     if not os.path.isabs(profiles_dir):
         profiles_dir = os.path.join(get_base_dir(), profiles_dir)
     return profiles_dir
 
-def load_profile(profile_name):
-    path = os.path.join(get_profiles_dir(), f"{profile_name}.json")
+def load_profile(profile_name, profiles_dir=None):
+    path = os.path.join(profiles_dir or get_profiles_dir(), f"{profile_name}.json")
     with open(path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
@@ -108,7 +109,8 @@ def list_all_profiles():
     """Lista todos los perfiles disponibles con su estado."""
     config = load_config()
     active_profiles = config.get("active_profiles", [])
-    profiles_dir = get_profiles_dir()
+    # config.json se lee una sola vez para todo el listado
+    profiles_dir = get_profiles_dir(config)
     
     result = []
     if not os.path.isdir(profiles_dir):
@@ -117,7 +119,7 @@ def list_all_profiles():
     for filepath in sorted(glob.glob(os.path.join(profiles_dir, "*.json"))):
         filename = os.path.splitext(os.path.basename(filepath))[0]
         try:
-            profile_data = load_profile(filename)
+            profile_data = load_profile(filename, profiles_dir)
             monitors = profile_data.get("monitors", [])
             active_monitors = sum(1 for m in monitors if m.get("active", True))
             total_monitors = len(monitors)
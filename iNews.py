@@ -3,11 +3,71 @@ import getpass
 import sys
 import json
 import argparse
+import os
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
+# Máximo de sesiones FTP adicionales que abre el comando 'tree'
+TREE_MAX_CONNECTIONS = 4
+# Intervalo de NOOP para que el servidor no cierre la sesión durante la inactividad
+KEEPALIVE_INTERVAL_SECONDS = 30
+
+
+class FTPKeepAlive:
+    """Envía NOOP periódicos en segundo plano sobre una conexión FTP compartida."""
+
+    def __init__(self, ftp, interval=KEEPALIVE_INTERVAL_SECONDS):
+        self._ftp = ftp
+        self.interval = interval
+        # Se comparte con la ejecución de comandos para no intercalar respuestas
+        self.lock = threading.Lock()
+        self._timer = None
+        self._stopped = False
+
+    def start(self):
+        self._schedule()
+
+    def _schedule(self):
+        if self._stopped:
+            return
+        self._timer = threading.Timer(self.interval, self._tick)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _tick(self):
+        with self.lock:
+            try:
+                self._ftp.voidcmd('NOOP')
+            except ftplib.all_errors:
+                pass
+        self._schedule()
+
+    def stop(self):
+        self._stopped = True
+        if self._timer:
+            self._timer.cancel()
+
+
+def _resolve_host(host):
+    """Resuelve el DNS una sola vez; si falla se usa el nombre tal cual."""
+    try:
+        return socket.gethostbyname(host)
+    except (socket.gaierror, UnicodeError):
+        return host
 
 def interactive_inews_shell(host, user, password):
     ftp = None
+    keepalive = None
     try:
         print(f"Connecting to {host}...")
+        host = _resolve_host(host)
         ftp = ftplib.FTP(host)
         print(f"Logging in as {user}...")
         ftp.login(user, password)
@@ -23,6 +83,8 @@ def interactive_inews_shell(host, user, password):
             pass
 
         current_path = "/"
+        keepalive = FTPKeepAlive(ftp)
+        keepalive.start()
         
         while True:
             try:
@@ -37,56 +99,64 @@ def interactive_inews_shell(host, user, password):
 
                 if cmd in ['exit', 'quit']:
                     break
-                
-                elif cmd == 'ls':
-                    print("Listing files...")
-                    try:
-                        files = []
-                        ftp.retrlines('LIST', files.append)
-                        for f in files:
-                            print(f)
-                        if not files:
-                            print("(Empty directory)")
-                    except ftplib.error_perm as e:
-                        print(f"Permission error: {e}")
-
-                elif cmd == 'cd':
-                    if not arg:
-                        print("Usage: cd <folder_name>")
-                        continue
-                    try:
-                        if arg == "..":
-                            ftp.cwd("..")
-                        else:
-                            ftp.cwd(arg)
-                        current_path = ftp.pwd()
-                    except ftplib.error_perm as e:
-                        print(f"Error changing directory: {e}")
-
-                elif cmd == 'pwd':
-                    print(ftp.pwd())
-
-                elif cmd == 'read':
-                    if not arg:
-                        print("Usage: read <filename>")
-                        continue
-                    print(f"Reading {arg}...")
-                    def print_line(line):
-                        print(line)
-                    try:
-                        # Try retrieving as ASCII text
-                        ftp.retrlines(f'RETR {arg}', print_line)
-                    except ftplib.error_perm as e:
-                        print(f"Error reading file: {e}")
-
-                elif cmd == 'tree':
-                    # Muestra un árbol de carpetas desde el directorio actual
-                    max_depth = int(arg) if arg and arg.isdigit() else 2
-                    print(f"Mostrando árbol (profundidad máx: {max_depth})...")
-                    _print_tree(ftp, ftp.pwd(), "", max_depth, 0)
-
-                else:
-                    print("Unknown command. Try 'ls', 'cd', 'read', 'pwd', 'tree [depth]', 'exit'")
+
+                with keepalive.lock:
+                    if cmd == 'ls':
+                        print("Listing files...")
+                        try:
+                            count = [0]
+                            def print_entry(line):
+                                count[0] += 1
+                                print(line)
+                            ftp.retrlines('LIST', print_entry)
+                            if count[0] == 0:
+                                print("(Empty directory)")
+                        except ftplib.error_perm as e:
+                            print(f"Permission error: {e}")
+
+                    elif cmd == 'cd':
+                        if not arg:
+                            print("Usage: cd <folder_name>")
+                            continue
+                        try:
+                            if arg == "..":
+                                ftp.cwd("..")
+                            else:
+                                ftp.cwd(arg)
+                            current_path = ftp.pwd()
+                        except ftplib.error_perm as e:
+                            print(f"Error changing directory: {e}")
+
+                    elif cmd == 'pwd':
+                        print(ftp.pwd())
+
+                    elif cmd == 'read':
+                        if not arg:
+                            print("Usage: read <filename>")
+                            continue
+                        print(f"Reading {arg}...")
+                        def print_line(line):
+                            print(line)
+                        try:
+                            # Try retrieving as ASCII text
+                            ftp.retrlines(f'RETR {arg}', print_line)
+                        except ftplib.error_perm as e:
+                            print(f"Error reading file: {e}")
+
+                    elif cmd == 'tree':
+                        # Muestra un árbol de carpetas desde el directorio actual
+                        max_depth = int(arg) if arg and arg.isdigit() else 2
+                        print(f"Mostrando árbol (profundidad máx: {max_depth})...")
+                        base_path = ftp.pwd()
+                        try:
+                            _print_tree_parallel(host, user, password, base_path, max_depth)
+                        except ftplib.all_errors as e:
+                            print(f"(árbol en paralelo no disponible: {e}; usando una sola conexión)")
+                            _print_tree(ftp, base_path, "", max_depth, 0)
+                            ftp.cwd(base_path)
+
+                    else:
+                        print("Unknown command. Try 'ls', 'cd', 'read', 'pwd', 'tree [depth]', 'exit'")
 
             except KeyboardInterrupt:
                 print("\nType 'exit' to quit.")
@@ -96,6 +166,8 @@ def interactive_inews_shell(host, user, password):
     except ftplib.all_errors as e:
         print(f"\nConnection Error: {e}")
     finally:
+        if keepalive:
+            keepalive.stop()
         if ftp:
             try:
                 ftp.quit()
@@ -104,25 +176,37 @@ def interactive_inews_shell(host, user, password):
             print("\nDisconnected.")
 
 
+def _list_dirs(ftp, base_path):
+    """Devuelve los subdirectorios de base_path (MLSD si el servidor lo soporta, si no LIST)."""
+    try:
+        return [name for name, facts in ftp.mlsd(base_path, facts=['type'])
+                if facts.get('type') == 'dir']
+    except ftplib.error_perm:
+        pass
+
+    ftp.cwd(base_path)
+    lines = []
+    ftp.retrlines('LIST', lines.append)
+
+    # Filtrar solo directorios
+    dirs = []
+    for line in lines:
+        parts = line.split()
+        if len(parts) >= 9 and line.startswith('d'):
+            name = " ".join(parts[8:])
+            dirs.append(name)
+        elif len(parts) < 9 and parts and line.startswith('d'):
+            dirs.append(parts[-1])
+    return dirs
+
+
 def _print_tree(ftp, base_path, prefix, max_depth, current_depth):
     """Imprime un árbol de directorios FTP recursivamente."""
     if current_depth >= max_depth:
         return
     
     try:
-        ftp.cwd(base_path)
-        lines = []
-        ftp.retrlines('LIST', lines.append)
-        
-        # Filtrar solo directorios
-        dirs = []
-        for line in lines:
-            parts = line.split()
-            if len(parts) >= 9 and line.startswith('d'):
-                name = " ".join(parts[8:])
-                dirs.append(name)
-            elif len(parts) < 9 and parts and line.startswith('d'):
-                dirs.append(parts[-1])
+        dirs = _list_dirs(ftp, base_path)
         
         for i, d in enumerate(dirs):
             is_last = (i == len(dirs) - 1)
@@ -139,11 +223,78 @@ def _print_tree(ftp, base_path, prefix, max_depth, current_depth):
         print(f"{prefix}  (error: {e})")
 
 
+def _print_tree_parallel(host, user, password, base_path, max_depth, max_workers=TREE_MAX_CONNECTIONS):
+    """
+    Imprime el árbol recorriéndolo por niveles: los listados de cada nivel se piden
+    en paralelo, con una conexión FTP propia por hilo (como máximo max_workers).
+    """
+    local = threading.local()
+    opened = []
+    opened_lock = threading.Lock()
+
+    def list_children(path):
+        ftp = getattr(local, "ftp", None)
+        if ftp is None:
+            ftp = ftplib.FTP(host)
+            with opened_lock:
+                opened.append(ftp)
+            ftp.login(user, password)
+            local.ftp = ftp
+        try:
+            return path, _list_dirs(ftp, path)
+        except ftplib.error_perm:
+            return path, []
+        except Exception as e:
+            return path, e
+
+    children = {}
+    level = [base_path]
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in range(max_depth):
+                if not level:
+                    break
+                next_level = []
+                for path, dirs in executor.map(list_children, level):
+                    children[path] = dirs
+                    if isinstance(dirs, list):
+                        next_level.extend(f"{path.rstrip('/')}/{d}" for d in dirs)
+                level = next_level
+    finally:
+        for ftp in opened:
+            try:
+                ftp.quit()
+            except:
+                pass
+
+    def render(path, prefix):
+        dirs = children.get(path, [])
+        if isinstance(dirs, Exception):
+            print(f"{prefix}  (error: {dirs})")
+            return
+        for i, d in enumerate(dirs):
+            is_last = (i == len(dirs) - 1)
+            connector = "└── " if is_last else "├── "
+            print(f"{prefix}{connector}{d}")
+            render(f"{path.rstrip('/')}/{d}", prefix + ("    " if is_last else "│   "))
+
+    render(base_path, "")
+
+
+@lru_cache(maxsize=8)
+def _read_config(config_path: str, mtime_ns: int) -> dict:
+    """Parsea el config; la clave incluye mtime_ns para invalidar si el archivo cambia."""
+    with open(config_path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
 def load_config_credentials(config_path: str):
     """Lee las credenciales de iNews del archivo de configuración JSON."""
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        config = _read_config(config_path, os.stat(config_path).st_mtime_ns)
         inews = config.get("inews", {})
         host = inews.get("host")
         user = inews.get("user")
@@ -12,25 +12,145 @@ Uso:
     python inews_monitor.py --config X   # Usar archivo de config alternativo
 """
 
+import atexit
 import ftplib
+import hashlib
 import json
 import logging
+import logging.handlers
+import queue
+import signal
 import argparse
 import time
 import re
 import os
+import socket
 import sys
 import csv
 import threading
 import zlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Any, List, Dict, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, List, Dict, Optional, Set, Tuple, Union
 from io import StringIO
 import io
-import requests
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None
+
+try:
+    # watchdog: recarga en caliente por eventos del sistema de archivos (opcional)
+    from watchdog.observers import Observer as _FsObserver  # type: ignore
+except Exception:  # pragma: no cover
+    _FsObserver = None
+
+try:
+    # RE2 (google-re2) garantiza tiempo lineal con los filtros <ap> configurados
+    import re2  # type: ignore
+except Exception:  # pragma: no cover
+    re2 = None
 from urllib.parse import urlparse
 
+# Expresiones regulares del parser NSML (compiladas una sola vez)
+_RE_AP = re.compile(r'<ap>(.*?)</ap>', re.DOTALL)
+_RE_CANAL = re.compile(r'\[([A-Za-z0-9\-]+)\]')
+# Tipo: primero "-- NN: Tipo" (código) y, si no aparece, "NN Tipo". Cada rama va
+# en un lookahead anclado al inicio para conservar la prioridad entre patrones.
+_RE_TIPO = re.compile(
+    r'(?:(?=[\s\S]*?--\s+\d+:\s+(?P<codigo>[A-Za-z_0-9]+))'
+    r'|(?=[\s\S]*?\d+\s+(?P<numero>[A-Za-z_][A-Za-z_0-9]*(?:\s+\d+)?)))'
+)
+_RE_CONTENIDO = re.compile(r'\|([^|\(]+)')
+# NSML no es XML bien formado (atributos sin comillas: <f id=title>), así que un
+# parser XML fallaría en cada story; se extrae con expresiones regulares.
+# Campos de cabecera que usa extract_story_info, en una sola búsqueda. Solo se
+# consume el prefijo literal "<f id=" (el motor lo localiza con búsqueda rápida) y
+# el resto va en un lookahead, así que las coincidencias pueden solaparse y cada
+# campo obtiene lo mismo que con extract_field
+_INFO_FIELDS = ("title", "status", "modify-by", "modify-date", "audio-time")
+_RE_INFO_FIELDS = re.compile(
+    r'<f id=(?=(' + "|".join(re.escape(f) for f in _INFO_FIELDS) + r')[^>]*>([^<]*)</f>)'
+)
+# Ids de contenido a partir de la URL de cada plataforma. Ids y nombres de story
+# son ASCII: re.ASCII evita que \d acepte dígitos Unicode (carpetas con nombres raros)
+_RE_TWITTER_ID = re.compile(r'/status/(\d+)', re.ASCII)
+_RE_BLUESKY_ID = re.compile(r'bsky\.app/profile/([^/]+)/post/([^/?#]+)', re.IGNORECASE)
+_RE_TRUTH_ID = re.compile(r'truthsocial\.com/@[^/]+/posts/(\d+)', re.IGNORECASE)
+_RE_UNSAFE_ID = re.compile(r'[^A-Za-z0-9_.-]+')
+_RE_UNSAFE_NAME = re.compile(r'[^A-Za-z0-9_.-]')
+# Nombres de story que no son stories reales (linX, sin alfanuméricos)
+_RE_LIN_NAME = re.compile(r'^lin\d+$', re.ASCII)
+_RE_ALNUM = re.compile(r'[A-Za-z0-9]')
+# Caracteres que obligan a csv.writer a entrecomillar un campo de index.csv
+_RE_CSV_SPECIAL = re.compile(r'[;"\r\n]')
+
+
+@lru_cache(maxsize=64)
+def _field_re(field_id: str) -> "re.Pattern[str]":
+    """Patrón <f id=field_id ...>valor</f> compilado y cacheado por campo."""
+    return re.compile(rf'<f id={re.escape(field_id)}[^>]*>([^<]*)</f>')
+
+
+def _tipos_key(tipos_validos) -> Tuple[str, ...]:
+    """Tupla hashable de tipos (sin copiar si ya lo es, caso de los watchers)."""
+    return tipos_validos if isinstance(tipos_validos, tuple) else tuple(tipos_validos)
+
+
+@lru_cache(maxsize=16)
+def _tipos_lower(tipos_validos: Tuple[str, ...]) -> frozenset:
+    """Conjunto en minúsculas de los tipos de rótulo válidos (cacheado por perfil)."""
+    return frozenset(t.lower() for t in tipos_validos)
+
+
+@lru_cache(maxsize=64)
+def _filter_re(filter_pattern: str) -> Optional["re.Pattern[str]"]:
+    """
+    Compila el filtro <ap> configurado; None si no es una regex válida.
+    Usa RE2 si está instalado (sin backtracking catastrófico) y vuelve a re
+    para patrones que RE2 no soporta (lookarounds, backreferences).
+    """
+    if re2 is not None:
+        try:
+            return re2.compile(filter_pattern)
+        except Exception:
+            pass
+    try:
+        return re.compile(filter_pattern)
+    except re.error:
+        return None
+
+
+@lru_cache(maxsize=64)
+def _is_literal_filter(filter_pattern: str) -> bool:
+    """True si el filtro no tiene metacaracteres: como regex equivale a buscar el texto."""
+    return re.escape(filter_pattern) == filter_pattern
+
+
+@lru_cache(maxsize=16)
+def _combined_filter_re(patterns: Tuple[str, ...]) -> Optional["re.Pattern[str]"]:
+    """
+    Une varios filtros <ap> en una alternancia (?:p1)|(?:p2)|... para evaluarlos
+    en una sola pasada. Devuelve None si no se pueden combinar (p.ej. grupos con
+    nombre repetidos o flags en línea); en ese caso se evalúan uno a uno.
+    """
+    valid = [p for p in patterns if _filter_re(p) is not None]
+    if not valid:
+        return None
+    combined = "|".join(f"(?:{p})" for p in valid)
+    if re2 is not None:
+        try:
+            return re2.compile(combined)
+        except Exception:
+            pass
+    try:
+        return re.compile(combined)
+    except re.error:
+        return None
+
+
 # Force UTF-8 for stdout/stderr to avoid crashes with emojis on Windows
 if sys.stdout.encoding != 'utf-8':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
@@ -38,6 +158,74 @@ if sys.stderr.encoding != 'utf-8':
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
 
 
+# Niveles de log admitidos en config.json (sin distinguir mayúsculas)
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+
+def _parse_log_level(value, default: int = logging.INFO) -> int:
+    return _LOG_LEVELS.get(str(value).strip().upper(), default)
+
+
+# Carpeta del script (rutas relativas de config y carpeta ScriptsTwitter local)
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter que reutiliza el asctime mientras no cambie el segundo."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_time = (-1, "")
+
+    def formatTime(self, record, datefmt=None):
+        datefmt = datefmt or self.datefmt
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        sec = int(record.created)
+        last_sec, last_str = self._last_time
+        if sec != last_sec:
+            last_str = time.strftime(datefmt, self.converter(sec))
+            # Tupla: lectura y escritura atómicas entre hilos
+            self._last_time = (sec, last_str)
+        return last_str
+
+
+# Segundos sin uso tras los que se comprueba la sesión con NOOP antes de reutilizarla
+LIVENESS_CHECK_AFTER_SECONDS = 15
+
+
+# Tamaño de cada recv en RETR: menos llamadas a buf.extend por story
+RETR_BLOCKSIZE = 64 * 1024
+
+
+def _set_nodelay(sock) -> None:
+    """Desactiva Nagle: los comandos FTP y las stories NSML son mensajes pequeños."""
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    except (OSError, AttributeError):
+        pass
+
+
+class _NoDelayFTP(ftplib.FTP):
+    """ftplib.FTP con TCP_NODELAY en el canal de control y en los de datos."""
+
+    def connect(self, *args, **kwargs):
+        welcome = super().connect(*args, **kwargs)
+        _set_nodelay(self.sock)
+        return welcome
+
+    def ntransfercmd(self, cmd, rest=None):
+        conn, size = super().ntransfercmd(cmd, rest)
+        _set_nodelay(conn)
+        return conn, size
+
+
 class INewsConnection:
     """Gestiona la conexión FTP a un servidor iNews."""
     
@@ -47,16 +235,28 @@ class INewsConnection:
         self.password = password
         self.ftp: Optional[ftplib.FTP] = None
         self.last_used = time.time()
+        # Último uso correcto de la sesión (monotónico, inmune a cambios de hora);
+        # 0 obliga a comprobarla con NOOP en el próximo ensure_connected
+        self._verified_at = 0.0
+        self._mlsd_supported: Optional[bool] = None  # None = aún no comprobado
+        self.current_path: Optional[str] = None  # Última ruta navegada (para reconectar)
+        self._cwd: Optional[str] = None  # Carpeta actual en el servidor para esta sesión
         self.logger = logging.getLogger(self.__class__.__name__)
 
     def mark_used(self):
         self.last_used = time.time()
+        self._verified_at = time.monotonic()
+
+    def invalidate(self):
+        """Tras un error de red: el próximo ensure_connected vuelve a comprobar la sesión."""
+        self._verified_at = 0.0
     
     def connect(self) -> bool:
         """Establece conexión con el servidor iNews."""
         try:
-            self.logger.info(f"Conectando a {self.host}...")
-            self.ftp = ftplib.FTP(self.host, timeout=30)
+            self.logger.info("Conectando a %s...", self.host)
+            self._cwd = None
+            self.ftp = _NoDelayFTP(self.host, timeout=30)
             self.ftp.login(self.user, self.password)
             
             # Intentar configurar charset UTF-8
@@ -65,6 +265,7 @@ class INewsConnection:
             except ftplib.error_perm:
                 pass
             
+            self.mark_used()
             self.logger.info("Conexión establecida correctamente")
             return True
         except ftplib.all_errors as e:
@@ -80,6 +281,7 @@ class INewsConnection:
             except:
                 pass
             self.ftp = None
+        self._cwd = None
     
     def is_connected(self) -> bool:
         """Verifica si la conexión está activa."""
@@ -93,7 +295,17 @@ class INewsConnection:
             return False
     
     def ensure_connected(self) -> bool:
-        """Asegura que haya una conexión activa, reconectando si es necesario."""
+        """
+        Asegura que haya una conexión activa, reconectando si es necesario.
+        Si la sesión se usó hace poco no se gasta un NOOP en comprobarla; los
+        fallos de red se detectan al usarla (ver read_story).
+        """
+        if (
+            self.ftp
+            and self._verified_at
+            and time.monotonic() - self._verified_at < LIVENESS_CHECK_AFTER_SECONDS
+        ):
+            return True
         if not self.is_connected():
             self.disconnect()
             return self.connect()
@@ -103,17 +315,25 @@ class INewsConnection:
         """Navega a una ruta específica en el servidor, carpeta por carpeta."""
         if not self.ensure_connected():
             return False
+        if path.startswith("/"):
+            path = path[1:]
+        if self._cwd == path:
+            # Ya estamos ahí (p.ej. el watcher navegó y luego lista la misma ruta)
+            self.current_path = path
+            return True
         try:
+            self._cwd = None
             self.ftp.cwd("/")  # Ir a raíz primero
-            if path.startswith("/"):
-                path = path[1:]
             if path:
                 # Navegar carpeta por carpeta
                 folders = path.replace("\\", "/").split("/")
                 for folder in folders:
                     if folder:  # Ignorar strings vacíos
                         self.ftp.cwd(folder)
-            self.logger.debug(f"Navegado a: {self.ftp.pwd()}")
+            self.current_path = path
+            self._cwd = path
+            self.mark_used()
+            self.logger.debug("Navegado a: /%s", path)
             return True
         except ftplib.error_perm as e:
             self.logger.error(f"Error navegando a {path}: {e}")
@@ -140,6 +360,28 @@ class INewsConnection:
         Lista las entradas del directorio parseando la salida LIST.
         Retorna una lista de diccionarios con información de cada entrada.
         """
+        if self._mlsd_supported is not False and self.ensure_connected():
+            try:
+                if path:
+                    self.navigate_to(path)
+                entries = [
+                    {
+                        "name": name,
+                        "is_dir": facts.get("type") == "dir",
+                        "size": facts.get("size", "0"),
+                        "raw": name
+                    }
+                    for name, facts in self.ftp.mlsd()
+                    if facts.get("type") not in ("cdir", "pdir")
+                ]
+                self._mlsd_supported = True
+                self.mark_used()
+                return entries
+            except ftplib.error_perm as e:
+                # El servidor no soporta MLSD: no volver a intentarlo en esta sesión
+                self.logger.info("MLSD no soportado, usando LIST: %s", e)
+                self._mlsd_supported = False
+        
         raw_list = self.list_directory(path)
         entries = []
         
@@ -152,10 +394,31 @@ class INewsConnection:
 
     def list_story_metadata(self, path: str = None) -> Dict[str, Dict[str, str]]:
         """
-        Obtiene metadata desde LIST para servidores que no soportan MDTM/SIZE.
-        Devuelve un mapa nombre_story -> firma estable de la linea LIST.
+        Obtiene metadata de todo el directorio en una sola orden: MLSD (facts
+        size/modify) si el servidor lo soporta y, si no, la línea de LIST.
+        Devuelve un mapa nombre_story -> firma estable.
         """
         metadata: Dict[str, Dict[str, str]] = {}
+        if self._mlsd_supported is not False and self.ensure_connected():
+            try:
+                if path:
+                    self.navigate_to(path)
+                for name, facts in self.ftp.mlsd():
+                    if facts.get("type") in ("dir", "cdir", "pdir") or not facts.get("modify"):
+                        continue
+                    metadata[name] = {
+                        "source": "MLSD",
+                        "signature": f"{facts.get('size', '')} {facts['modify']}",
+                        "size": facts.get("size", "")
+                    }
+                self._mlsd_supported = True
+                self.mark_used()
+                if metadata:
+                    return metadata
+            except ftplib.error_perm as e:
+                self.logger.info("MLSD no soportado, usando LIST: %s", e)
+                self._mlsd_supported = False
+
         raw_list = self.list_directory(path)
         for line in raw_list:
             parsed = self._parse_list_metadata_line(line)
@@ -219,6 +482,8 @@ class INewsConnection:
             return deduped
 
         except ftplib.all_errors as e:
+            if not isinstance(e, ftplib.error_perm):
+                self.invalidate()
             self.logger.warning(f"NLST falló, usando LIST parseado como respaldo: {e}")
 
         # Respaldo: LIST parseado
@@ -256,18 +521,32 @@ class INewsConnection:
             return None
         
         try:
-            content_lines = []
-            
-            def collect_line(line):
-                content_lines.append(line)
-            
-            self.ftp.retrlines(f'RETR {filename}', collect_line)
-            self.mark_used()
-            return '\n'.join(content_lines)
+            try:
+                buf = self._retr(filename)
+            except (OSError, EOFError, ftplib.error_temp, ftplib.error_reply) as e:
+                # Sesión caída sin NOOP previo: reconectar, volver a la carpeta y reintentar una vez
+                self.logger.warning("Conexión perdida leyendo %s (%s); reconectando...", filename, e)
+                self.disconnect()
+                if not self.connect():
+                    return None
+                if self.current_path is not None and not self.navigate_to(self.current_path):
+                    return None
+                buf = self._retr(filename)
+            # Un único decode; se normalizan los saltos de línea como hacía retrlines
+            text = buf.decode('utf-8', errors='replace')
+            if b'\r' in buf:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
+            return text[:-1] if text.endswith('\n') else text
         except ftplib.error_perm as e:
             self.logger.error(f"Error leyendo {filename}: {e}")
             return None
 
+    def _retr(self, filename: str) -> bytearray:
+        buf = bytearray()
+        self.ftp.retrbinary(f'RETR {filename}', buf.extend, blocksize=RETR_BLOCKSIZE)
+        self.mark_used()
+        return buf
+
     def get_story_metadata(self, filename: str) -> Optional[Dict[str, str]]:
         """
         Obtiene metadata ligera para evitar RETR cuando la story no ha cambiado.
@@ -280,7 +559,9 @@ class INewsConnection:
         try:
             mdtm_response = self.ftp.sendcmd(f"MDTM {filename}")
             metadata["mtime"] = mdtm_response.strip()
-        except ftplib.all_errors:
+        except ftplib.all_errors as e:
+            if not isinstance(e, ftplib.error_perm):
+                self.invalidate()
             return None
 
         try:
@@ -336,6 +617,9 @@ class INewsConnectionPool:
         self._available: Dict[str, List[INewsConnection]] = {host: [] for host in self.hosts}
         self._in_use: Dict[str, int] = {host: 0 for host in self.hosts}
         self._open_count: Dict[str, int] = {host: 0 for host in self.hosts}
+        # Hilos bloqueados en acquire por host: mientras haya alguno no se prestan
+        # sesiones extra para lecturas en paralelo, la plaza que se libere es suya
+        self._waiting: Dict[str, int] = {host: 0 for host in self.hosts}
         self._next_host_index = 0
 
     def choose_host(self, key: str) -> str:
@@ -356,26 +640,62 @@ class INewsConnectionPool:
 
         with self._condition:
             while True:
-                self._close_idle_locked()
-
-                if self._available[host]:
-                    connection = self._available[host].pop()
-                    self._in_use[host] += 1
-                    return INewsConnectionLease(self, connection)
-
-                total_open = sum(self._open_count.values())
-                if total_open < self.max_total and self._open_count[host] < self.max_per_host:
-                    self._open_count[host] += 1
-                    self._in_use[host] += 1
-                    return INewsConnectionLease(self, INewsConnection(host, self.user, self.password))
+                lease = self._acquire_locked(host)
+                if lease is not None:
+                    return lease
 
                 remaining = deadline - time.time()
                 if remaining <= 0:
                     raise TimeoutError(f"No hay conexiones FTP disponibles para {host}")
-                self._condition.wait(timeout=min(remaining, 1.0))
+                self._waiting[host] += 1
+                try:
+                    self._condition.wait(timeout=min(remaining, 1.0))
+                finally:
+                    self._waiting[host] -= 1
+
+    def try_acquire(self, preferred_host: Optional[str] = None) -> Optional[INewsConnectionLease]:
+        """Como acquire, pero devuelve None en vez de esperar si no hay capacidad."""
+        host = preferred_host if preferred_host in self._available else self.hosts[0]
+        with self._condition:
+            return self._acquire_locked(host)
+
+    def has_waiters(self) -> bool:
+        """True si algún hilo espera sesión en acquire (en cualquier host)."""
+        with self._condition:
+            return any(self._waiting.values())
+
+    def try_acquire_extra(self, preferred_host: Optional[str] = None) -> Optional[INewsConnectionLease]:
+        """
+        Sesión adicional para leer en paralelo: solo si hay capacidad libre y ningún
+        watcher está esperando en acquire, así las lecturas de uno no dejan a los
+        demás sin sesión. Quien la usa debe soltarla en cuanto has_waiters() lo pida.
+        """
+        host = preferred_host if preferred_host in self._available else self.hosts[0]
+        with self._condition:
+            if any(self._waiting.values()):
+                return None
+            return self._acquire_locked(host)
+
+    def _acquire_locked(self, host: str) -> Optional[INewsConnectionLease]:
+        self._close_idle_locked()
+
+        if self._available[host]:
+            connection = self._available[host].pop()
+            self._in_use[host] += 1
+            return INewsConnectionLease(self, connection)
+
+        total_open = sum(self._open_count.values())
+        if total_open < self.max_total and self._open_count[host] < self.max_per_host:
+            self._open_count[host] += 1
+            self._in_use[host] += 1
+            return INewsConnectionLease(self, INewsConnection(host, self.user, self.password))
+
+        return None
 
     def release(self, connection: INewsConnection):
-        connection.mark_used()
+        # Solo cuenta para la caducidad por inactividad: devolverla al pool no prueba
+        # que la sesión siga viva (una invalidada debe hacer NOOP al reutilizarse)
+        connection.last_used = time.time()
         with self._condition:
             host = connection.host
             self._in_use[host] = max(0, self._in_use.get(host, 0) - 1)
@@ -411,9 +731,13 @@ class INewsConnectionPool:
 class Rotulo:
     """Representa un rótulo extraído de una etiqueta <ap>."""
     
+    __slots__ = ("canal", "tipo", "tipo_lower", "contenido")
+    
     def __init__(self, canal: str, tipo: str, contenido: str):
-        self.canal = canal      # Ej: CG1
-        self.tipo = tipo        # Ej: Faldon, X_Total, X_Faldon
+        # canal y tipo se repiten mucho entre historias: se internan
+        self.canal = sys.intern(canal) if canal else canal      # Ej: CG1
+        self.tipo = sys.intern(tipo) if tipo else tipo          # Ej: Faldon, X_Total, X_Faldon
+        self.tipo_lower = sys.intern(tipo.lower()) if tipo else ""
         self.contenido = contenido  # La URL o texto del contenido
     
     def __repr__(self):
@@ -440,15 +764,21 @@ class StoryParser:
     @staticmethod
     def extract_ap_tags(content: str) -> List[str]:
         """Extrae todos los contenidos de etiquetas <ap>."""
-        # Regex para encontrar contenido entre <ap> y </ap>
-        pattern = r'<ap>(.*?)</ap>'
-        matches = re.findall(pattern, content, re.DOTALL)
-        return matches
+        return _RE_AP.findall(content)
+    
+    @staticmethod
+    def _iter_ap_tags(content: str) -> Iterator[str]:
+        """Recorre las etiquetas <ap> de forma perezosa (permite cortar al primer acierto)."""
+        for match in _RE_AP.finditer(content):
+            yield match.group(1)
     
     @staticmethod
+    @lru_cache(maxsize=4096)
     def parse_rotulo_from_ap(ap_content: str) -> Optional[Rotulo]:
         """
         Parsea un rótulo desde el contenido de una etiqueta <ap>.
+        Cacheado por texto: al editar una story casi todos sus <ap> siguen iguales.
+        El Rotulo devuelto es compartido; no debe modificarse.
         
         Soporta múltiples formatos:
         1. Con [canal]: [A1-A2-A3] 10 QR -- 00010829: |contenido|
@@ -465,7 +795,7 @@ class StoryParser:
         
         try:
             # Buscar canal entre corchetes [XXX]
-            canal_match = re.search(r'\[([A-Za-z0-9\-]+)\]', ap_content)
+            canal_match = _RE_CANAL.search(ap_content)
             canal = canal_match.group(1).strip() if canal_match else ""
             
             # Si hay canal, obtener el texto después de él
@@ -479,29 +809,22 @@ class StoryParser:
             # - O la primera palabra: "Faldon", "Titular", etc.
             tipo = ""
             
-            # Intentar extraer tipo después de patrón "NN -- " (código)
-            tipo_match = re.search(r'--\s+\d+:\s+([A-Za-z_0-9]+)', after_canal)
+            # Una sola pasada: patrón "-- NN: Tipo" o, en su defecto, "NN Tipo"
+            tipo_match = _RE_TIPO.match(after_canal)
             if tipo_match:
-                tipo = tipo_match.group(1).strip()
-            
-            # Si no encontró con patrón anterior, buscar palabra antes de | o después de números
-            if not tipo:
-                # Buscar patrón: números, espacios, luego palabras antes de |
-                tipo_match = re.search(r'\d+\s+([A-Za-z_][A-Za-z_0-9]*(?:\s+\d+)?)', after_canal)
-                if tipo_match:
-                    tipo = tipo_match.group(1).strip()
-                else:
-                    # Última opción: primera palabra no numérica
-                    words = after_canal.split()
-                    for word in words:
-                        if not word.replace('-', '').isdigit() and word not in [']', '[[', ']]', '|', '--']:
-                            tipo = word.strip()
-                            break
+                tipo = (tipo_match.group('codigo') or tipo_match.group('numero')).strip()
+            else:
+                # Última opción: primera palabra no numérica
+                words = after_canal.split()
+                for word in words:
+                    if not word.replace('-', '').isdigit() and word not in [']', '[[', ']]', '|', '--']:
+                        tipo = word.strip()
+                        break
             
             # Extraer contenido entre el primer | y el siguiente | o (
             contenido = ""
             # Patrón: después de | y antes de ( o siguiente |
-            contenido_match = re.search(r'\|([^|\(]+)', after_canal)
+            contenido_match = _RE_CONTENIDO.search(after_canal)
             if contenido_match:
                 contenido = contenido_match.group(1).strip()
                 # Limpiar espacios extras
@@ -522,7 +845,11 @@ class StoryParser:
         """
         Extrae todos los rótulos de todas las etiquetas <ap> de una historia.
         """
-        ap_tags = StoryParser.extract_ap_tags(content)
+        return StoryParser._rotulos_from_aps(StoryParser._iter_ap_tags(content))
+    
+    @staticmethod
+    def _rotulos_from_aps(ap_tags: Iterable[str]) -> List[Rotulo]:
+        """Parsea los rótulos de una lista de <ap> ya extraída."""
         rotulos = []
         
         for ap in ap_tags:
@@ -532,6 +859,15 @@ class StoryParser:
         
         return rotulos
     
+    @staticmethod
+    def _filter_rotulos(rotulos: List[Rotulo], tipos_validos: List[str] = None) -> List[Rotulo]:
+        """Filtra rótulos ya parseados por tipo (case-insensitive)."""
+        if tipos_validos is None:
+            tipos_validos = StoryParser.TIPOS_VALIDOS
+        
+        tipos_lower = _tipos_lower(_tipos_key(tipos_validos))
+        return [r for r in rotulos if r.tipo_lower in tipos_lower]
+    
     @staticmethod
     def extract_rotulos_filtrados(content: str, tipos_validos: List[str] = None) -> List[Rotulo]:
         """
@@ -544,16 +880,8 @@ class StoryParser:
         Returns:
             Lista de rótulos que coinciden con los tipos válidos
         """
-        if tipos_validos is None:
-            tipos_validos = StoryParser.TIPOS_VALIDOS
-        
         all_rotulos = StoryParser.extract_rotulos(content)
-        
-        # Filtrar por tipo (case-insensitive)
-        tipos_lower = [t.lower() for t in tipos_validos]
-        filtered = [r for r in all_rotulos if r.tipo.lower() in tipos_lower]
-        
-        return filtered
+        return StoryParser._filter_rotulos(all_rotulos, tipos_validos)
     
     @staticmethod
     def extract_urls_from_story(content: str) -> List[str]:
@@ -577,11 +905,35 @@ class StoryParser:
                 clean = clean.split(sep, 1)[0]
         return clean.rstrip(".,;:|)]}>")
 
+    @staticmethod
+    def _find_social_urls(text: str) -> List[str]:
+        """
+        Equivale a SOCIAL_URL_PATTERN.findall(text). La regex no tiene prefijo literal
+        (IGNORECASE), así que recorrerla sobre toda la story es caro; en su lugar se
+        localiza cada "://" con str.find y solo se prueba la regex en el inicio posible
+        ("https" o "http" justo antes).
+        """
+        pattern = StoryParser.SOCIAL_URL_PATTERN
+        found: List[str] = []
+        last_end = 0
+        i = text.find("://")
+        while i != -1:
+            for start in (i - 5, i - 4):
+                if start < last_end:
+                    continue
+                match = pattern.match(text, start)
+                if match:
+                    found.append(match.group(0))
+                    last_end = match.end()
+                    break
+            i = text.find("://", max(i + 3, last_end))
+        return found
+
     @staticmethod
     def _extract_social_urls_from_text(text: str) -> List[str]:
         if not text:
             return []
-        matches = StoryParser.SOCIAL_URL_PATTERN.findall(text)
+        matches = StoryParser._find_social_urls(text)
         normalized = []
         for m in matches:
             clean = StoryParser._normalize_url(m)
@@ -590,7 +942,7 @@ class StoryParser:
         return normalized
 
     @staticmethod
-    def extract_social_urls(content: str) -> List[str]:
+    def extract_social_urls(content: str, tipos_validos: List[str] = None) -> List[str]:
         """
         Extrae URLs sociales de forma robusta:
         1) rotulos filtrados por tipo
@@ -598,17 +950,29 @@ class StoryParser:
         3) contenido bruto de <ap>
         4) contenido completo NSML (respaldo)
         """
+        ap_tags = StoryParser.extract_ap_tags(content)
+        all_rotulos = StoryParser._rotulos_from_aps(ap_tags)
+        return StoryParser._social_urls_from_parsed(
+            content, ap_tags, all_rotulos, StoryParser._filter_rotulos(all_rotulos, tipos_validos)
+        )
+
+    @staticmethod
+    def _social_urls_from_parsed(
+        content: str,
+        ap_tags: List[str],
+        all_rotulos: List[Rotulo],
+        filtered_rotulos: List[Rotulo],
+    ) -> List[str]:
+        """Igual que extract_social_urls, reutilizando <ap> y rótulos ya parseados."""
         urls: List[str] = []
 
-        filtered_rotulos = StoryParser.extract_rotulos_filtrados(content)
         for rotulo in filtered_rotulos:
             urls.extend(StoryParser._extract_social_urls_from_text(rotulo.contenido))
 
-        all_rotulos = StoryParser.extract_rotulos(content)
         for rotulo in all_rotulos:
             urls.extend(StoryParser._extract_social_urls_from_text(rotulo.contenido))
 
-        for ap in StoryParser.extract_ap_tags(content):
+        for ap in ap_tags:
             urls.extend(StoryParser._extract_social_urls_from_text(ap))
 
         # Buscar también en todo el contenido bruto por si hay formato NSML raro
@@ -628,27 +992,41 @@ class StoryParser:
     def extract_field(content: str, field_id: str) -> Optional[str]:
         """Extrae el valor de un campo específico del NSML."""
         # Buscar <f id=field_id>valor</f>
-        pattern = rf'<f id={field_id}[^>]*>([^<]*)</f>'
-        match = re.search(pattern, content)
+        match = _field_re(field_id).search(content)
         if match:
             return match.group(1)
         return None
     
     @staticmethod
-    def extract_story_info(content: str) -> Dict:
+    def _extract_info_fields(content: str) -> Dict[str, str]:
+        """Primer valor de cada campo de _INFO_FIELDS, en un único recorrido."""
+        fields: Dict[str, str] = {}
+        for match in _RE_INFO_FIELDS.finditer(content):
+            fields.setdefault(match.group(1), match.group(2))
+            if len(fields) == len(_INFO_FIELDS):
+                break
+        return fields
+    
+    @staticmethod
+    def extract_story_info(content: str, tipos_validos: List[str] = None) -> Dict:
         """Extrae información relevante de una historia NSML."""
-        rotulos = StoryParser.extract_rotulos(content)
-        rotulos_filtrados = StoryParser.extract_rotulos_filtrados(content)
-        social_urls = StoryParser.extract_social_urls(content)
+        # Una sola pasada sobre <ap>; rótulos y URLs se derivan de ella
+        ap_tags = StoryParser.extract_ap_tags(content)
+        rotulos = StoryParser._rotulos_from_aps(ap_tags)
+        rotulos_filtrados = StoryParser._filter_rotulos(rotulos, tipos_validos)
+        social_urls = StoryParser._social_urls_from_parsed(
+            content, ap_tags, rotulos, rotulos_filtrados
+        )
         
+        fields = StoryParser._extract_info_fields(content)
         info = {
-            "title": StoryParser.extract_field(content, "title") or "",
-            "status": StoryParser.extract_field(content, "status") or "",
-            "modify_by": StoryParser.extract_field(content, "modify-by") or "",
-            "modify_date": StoryParser.extract_field(content, "modify-date") or "",
-            "audio_time": StoryParser.extract_field(content, "audio-time") or "",
-            "ap_tags": StoryParser.extract_ap_tags(content),
-            "has_ap_content": len(StoryParser.extract_ap_tags(content)) > 0,
+            "title": fields.get("title", ""),
+            "status": fields.get("status", ""),
+            "modify_by": fields.get("modify-by", ""),
+            "modify_date": fields.get("modify-date", ""),
+            "audio_time": fields.get("audio-time", ""),
+            "ap_tags": ap_tags,
+            "has_ap_content": bool(ap_tags),
             "rotulos": [r.to_dict() for r in rotulos],
             "rotulos_filtrados": [r.to_dict() for r in rotulos_filtrados],
             "urls": social_urls
@@ -656,15 +1034,25 @@ class StoryParser:
         return info
     
     @staticmethod
-    def has_valid_rotulos(content: str) -> bool:
+    def has_valid_rotulos(content: str, tipos_validos: List[str] = None) -> bool:
         """
         Verifica si la historia tiene al menos un rótulo válido (X_Total o X_Faldon).
         """
-        rotulos = StoryParser.extract_rotulos_filtrados(content)
-        return len(rotulos) > 0
+        if tipos_validos is None:
+            tipos_validos = StoryParser.TIPOS_VALIDOS
+        tipos_lower = _tipos_lower(_tipos_key(tipos_validos))
+        for ap in StoryParser._iter_ap_tags(content):
+            rotulo = StoryParser.parse_rotulo_from_ap(ap)
+            if rotulo and rotulo.tipo_lower in tipos_lower:
+                return True
+        return False
     
     @staticmethod
-    def matches_ap_filter(content: str, filter_pattern: str) -> bool:
+    def matches_ap_filter(
+        content: str,
+        filter_pattern: Union[str, List[str], Tuple[str, ...]],
+        tipos_validos: List[str] = None
+    ) -> bool:
         """
         Verifica si alguna etiqueta <ap> coincide con el patrón de filtro.
         
@@ -675,38 +1063,119 @@ class StoryParser:
             content: Contenido NSML de la historia
             filter_pattern: Patrón a buscar (texto o regex). 
                           Si es "ROTULOS" (especial), filtra por tipos válidos.
+                          Si es una lista, basta con que coincida cualquiera.
+            tipos_validos: Tipos de rótulo del perfil. Por defecto: TIPOS_VALIDOS
         
         Returns:
             True si hay coincidencia
         """
+        if isinstance(filter_pattern, (list, tuple)):
+            return StoryParser._matches_any_filter(content, tuple(filter_pattern), tipos_validos)
+
         # Modo especial: filtrar solo entradas con rótulos válidos
         if filter_pattern == "ROTULOS":
-            return StoryParser.has_valid_rotulos(content)
+            return StoryParser.has_valid_rotulos(content, tipos_validos)
 
         if filter_pattern == "":
-            return len(StoryParser.extract_social_urls(content)) > 0
+            return len(StoryParser.extract_social_urls(content, tipos_validos)) > 0
         
-        ap_contents = StoryParser.extract_ap_tags(content)
+        # Filtro literal ausente de toda la historia: tampoco está en ningún <ap>
+        if _is_literal_filter(filter_pattern) and filter_pattern not in content:
+            return False
         
-        for ap in ap_contents:
+        for ap in StoryParser._iter_ap_tags(content):
             # Primero intentar como texto simple (contiene)
             if filter_pattern in ap:
                 return True
-            # Luego como regex
-            try:
-                if re.search(filter_pattern, ap):
-                    return True
-            except re.error:
-                pass  # Patrón no es regex válido, ya intentamos como texto
+            # Luego como regex (si el patrón no es regex válido, ya intentamos como texto)
+            filter_re = _filter_re(filter_pattern)
+            if filter_re is not None and filter_re.search(ap):
+                return True
         
         return False
 
+    @staticmethod
+    def _matches_any_filter(content: str, patterns: Tuple[str, ...], tipos_validos: List[str] = None) -> bool:
+        """matches_ap_filter para una lista de patrones: una sola regex combinada por <ap>."""
+        if "ROTULOS" in patterns and StoryParser.has_valid_rotulos(content, tipos_validos):
+            return True
+        if "" in patterns and StoryParser.extract_social_urls(content, tipos_validos):
+            return True
+
+        texts = tuple(p for p in patterns if p not in ("", "ROTULOS"))
+        if not texts:
+            return False
+        if all(_is_literal_filter(t) and t not in content for t in texts):
+            return False
+        combined = _combined_filter_re(texts)
+        for ap in StoryParser._iter_ap_tags(content):
+            if any(text in ap for text in texts):
+                return True
+            if combined is not None:
+                if combined.search(ap):
+                    return True
+            else:
+                for text in texts:
+                    filter_re = _filter_re(text)
+                    if filter_re is not None and filter_re.search(ap):
+                        return True
+        return False
+
+
+
+@lru_cache(maxsize=32)
+def _read_json_cached(path: str, mtime_ns: int, size: int) -> Dict:
+    """
+    Parsea un JSON de configuración; la clave incluye mtime y tamaño, así que un
+    archivo modificado se vuelve a leer. En una recarga en caliente solo se
+    reparsean los archivos que cambiaron. El dict es compartido: solo lectura.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+@lru_cache(maxsize=512)
+def _story_info_cached(fingerprint: str, tipos_validos: Tuple[str, ...], content: str) -> Dict:
+    """
+    Memoiza extract_story_info entre watchers (misma story en varios minutados).
+    La clave incluye los tipos válidos del perfil y el propio contenido, así que
+    una colisión de huella no puede devolver la info de otra historia.
+    El dict devuelto es compartido: tratarlo como de solo lectura.
+    """
+    return StoryParser.extract_story_info(content, tipos_validos)
 
 
 import shutil
 import subprocess
 import importlib.util
 
+
+def _import_script_module(scripts_path: str, module_name: str):
+    """
+    Importa un módulo de ScriptsTwitter directamente desde su fichero, sin
+    recorrer sys.path (en Windows puede incluir rutas de red lentas).
+    Se registra en sys.modules, así que cada módulo se carga una sola vez.
+    """
+    module = sys.modules.get(module_name)
+    if module is not None:
+        return module
+    spec = importlib.util.spec_from_file_location(
+        module_name, os.path.join(scripts_path, module_name + ".py")
+    )
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No se encontró {module_name} en {scripts_path}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
 def _robust_rmtree(path: str, logger=None) -> bool:
     """
     Elimina un directorio de forma robusta, manejando errores de permisos.
@@ -734,7 +1203,7 @@ def _robust_rmtree(path: str, logger=None) -> bool:
             return True
     except Exception as e:
         if logger:
-            logger.debug(f"shutil.rmtree falló para {path}: {e}")
+            logger.debug("shutil.rmtree falló para %s: %s", path, e)
     
     # Método 2: Usar cmd rmdir /s /q (Windows)
     if os.name == 'nt':
@@ -748,7 +1217,7 @@ def _robust_rmtree(path: str, logger=None) -> bool:
                 return True
         except Exception as e:
             if logger:
-                logger.debug(f"cmd rmdir falló para {path}: {e}")
+                logger.debug("cmd rmdir falló para %s: %s", path, e)
         
         # Método 3: takeown + icacls + rmdir (requiere permisos)
         try:
@@ -771,7 +1240,7 @@ def _robust_rmtree(path: str, logger=None) -> bool:
                 return True
         except Exception as e:
             if logger:
-                logger.debug(f"takeown/icacls falló para {path}: {e}")
+                logger.debug("takeown/icacls falló para %s: %s", path, e)
     
     # Si llegamos aquí, no pudimos eliminar
     if logger:
@@ -779,6 +1248,182 @@ def _robust_rmtree(path: str, logger=None) -> bool:
     return False
 
 
+@lru_cache(maxsize=None)
+def _build_custom_tweet_scraper(base_cls: type) -> type:
+    """
+    Subclase de TweetScraper con carpetas y JSON por tweet. Se construye una sola
+    vez por clase base y se reutiliza en cada ContentManager (también tras recargar).
+    """
+    class CustomTweetScraper(base_cls):
+        def __init__(self, output_dir: str, download_emojis: bool = True):
+            """Inicializa sin crear directorios aún (se crean por tweet)."""
+            self.download_emojis = download_emojis
+            super().__init__(output_dir)
+            # No llamar a _setup_directories() aquí para evitar crear
+            # carpetas innecesarias en la raíz base
+        
+        def _setup_directories(self):
+            """Crea directorios base, opcionalmente la carpeta de emojis."""
+            os.makedirs(self.output_dir, exist_ok=True)
+            os.makedirs(self.temp_folder_video, exist_ok=True)
+            if self.download_emojis:
+                os.makedirs(self.emojis_dir, exist_ok=True)
+
+        def get_tweet_data(self, tweet_id: str) -> Dict:
+            """
+            Fuerza la solicitud del campo note_tweet para obtener texto completo
+            en tweets largos (evita truncado en data.text).
+            """
+            url = f"https://api.twitter.com/2/tweets/{tweet_id}"
+            params = {
+                "expansions": "author_id,attachments.media_keys",
+                "tweet.fields": "created_at,text,note_tweet",
+                "user.fields": "name,username,profile_image_url",
+                "media.fields": "url,type"
+            }
+            headers = {"Authorization": f"Bearer {self.bearer_token}"}
+            response = self.session.get(url, params=params, headers=headers)
+            if response.status_code != 200:
+                raise Exception(f"Error {response.status_code}: {response.text}")
+            return response.json()
+
+        def extract_relevant_data(self, json_data: Dict) -> Dict:
+            """
+            Mantiene la logica base, pero prioriza note_tweet.text cuando existe.
+            """
+            data = super().extract_relevant_data(json_data)
+            tweet = json_data.get("data", {})
+            note_tweet = tweet.get("note_tweet", {})
+            full_text = note_tweet.get("text") if isinstance(note_tweet, dict) else ""
+
+            if full_text:
+                text = self.clean_tweet_text(full_text)
+                text, texto_traducido = self.traducir_texto(text)
+                data["text"] = text
+                data["text_traducido"] = texto_traducido
+
+            return data
+
+        def run(self, tweet_url: str):
+            """Sobrescribe run para personalizar paths y JSON."""
+            tweet_id = self.extract_tweet_id(tweet_url)
+            if not tweet_id:
+                print(f"[X] No se pudo extraer ID")
+                return
+
+            try:
+                # Crear carpeta para este tweet (con Emojis dentro); TempVideo
+                # solo se crea si el tweet tiene video
+                tweet_dir = os.path.join(self.output_dir, tweet_id)
+                os.makedirs(os.path.join(tweet_dir, "Emojis"), exist_ok=True)
+                
+                # Actualizar directorios de salida de la instancia
+                self.output_dir = tweet_dir  # Base para el JSON
+                self.output_folder_images = tweet_dir
+                self.output_folder_media = tweet_dir
+                self.temp_folder_video = os.path.join(tweet_dir, "TempVideo")
+                self.emojis_dir = os.path.join(tweet_dir, "Emojis")
+
+                # --- Lógica original adaptada ---
+                json_data = self.get_tweet_data(tweet_id)
+                data = self.extract_relevant_data(json_data)
+
+                # Rutas absolutas para el JSON
+                abs_profile = os.path.abspath(os.path.join(tweet_dir, "FotoPerfil.jpg")).replace("\\", "/")
+                abs_post_img = os.path.abspath(os.path.join(tweet_dir, "FotoPost.jpg")).replace("\\", "/")
+                abs_video = os.path.abspath(os.path.join(tweet_dir, "VideoPost.mp4")).replace("\\", "/")
+
+                # Imágenes (se descargan en paralelo junto con los emojis)
+                downloads = []
+                if data.get("profile_image"):
+                    downloads.append((data["profile_image"], os.path.join(self.output_folder_images, "FotoPerfil.jpg")))
+                    data["profile_image"] = abs_profile
+                else:
+                    data["profile_image"] = ""
+
+                if data.get("tweet_image"):
+                    downloads.append((data["tweet_image"], os.path.join(self.output_folder_images, "FotoPost.jpg")))
+                    data["tweet_image"] = abs_post_img
+                else:
+                    data["tweet_image"] = ""
+
+                # Manejo de Video
+                data["tweet_video"] = "" # Default vacío
+                
+                video_original_path = os.path.join(self.temp_folder_video, "VideoOriginal.mp4")
+                video_final_path = os.path.join(self.output_folder_media, "VideoPost.mp4")
+
+                # Limpieza previa de video (sin comprobar antes si existe)
+                for path in (video_original_path, video_final_path):
+                    try: os.remove(path)
+                    except OSError: pass
+
+                if data.get("has_video"):
+                    os.makedirs(self.temp_folder_video, exist_ok=True)
+                    self.download_video_or_gif(tweet_url)
+                    full_downloaded_path = self._find_downloaded_video()
+                    
+                    if full_downloaded_path:
+                        if self.convertir_a_25fps(full_downloaded_path, video_final_path, consume_input=True) and os.path.exists(video_final_path):
+                            data["tweet_video"] = abs_video
+                            print(f"[OK] Video guardado: {abs_video}")
+                        else:
+                            print(f"[X] No se pudo preparar el video final: {video_final_path}")
+
+                # Eliminar has_video si no se quiere en JSON final o dejarlo
+                if "has_video" in data: del data["has_video"]
+
+                # Emojis (Lógica igual, rutas relativas dentro de carpeta tweet)
+                if self.download_emojis:
+                    emojis = self._collect_emojis(data.get("text", ""), data.get("name", ""))
+                    emoji_map = {emoji: f"\\oemj {i+1};" for i, emoji in enumerate(emojis)}
+
+                    for idx, emoji_char in enumerate(emojis, start=1):
+                        filepath = os.path.join(self.emojis_dir, f"emoji{idx}.png")
+                        if not self.copy_local_emoji(emoji_char, filepath):
+                            downloads.append((self.emoji_url(emoji_char), filepath))
+
+                    emoji_pattern = self.compile_emoji_pattern(emoji_map)
+                    if "text" in data: data["text"] = self.replace_emojis_with_oemj(data["text"], emoji_map, emoji_pattern)
+                    if "name" in data: data["name"] = self.replace_emojis_with_oemj(data["name"], emoji_map, emoji_pattern)
+                    if "text_traducido" in data: data["text_traducido"] = self.replace_emojis_with_oemj(data["text_traducido"], emoji_map, emoji_pattern)
+
+                self._download_many(downloads)
+
+                # Guardar JSON
+                json_path = os.path.join(self.output_dir, "tweet_api.json")
+                self.save_to_json(data, json_path)
+                print(f"[OK] JSON guardado en: {json_path}")
+                
+                # Limpiar temp video
+                try: shutil.rmtree(self.temp_folder_video)
+                except: pass
+
+                # FINALMENTE: Asegurar permisos para todos los archivos generados
+                self._grant_permissions(tweet_dir)
+
+            except Exception as e:
+                print(f"[X] Error procesando tweet {tweet_id}: {e}")
+                import traceback
+                traceback.print_exc()
+            finally:
+                self.session.close()
+
+        def _grant_permissions(self, path: str):
+            """Otorga control total a Everyone/Todos sobre la carpeta y su contenido."""
+            try:
+                # Intentar grupo en Inglés
+                subprocess.run(['icacls', path, '/grant', 'Everyone:F', '/t', '/c', '/q'], 
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                # Intentar grupo en Español
+                subprocess.run(['icacls', path, '/grant', 'Todos:F', '/t', '/c', '/q'], 
+                             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            except Exception as e:
+                print(f"⚠️ Warning: No se pudieron establecer permisos explícitos: {e}")
+
+    return CustomTweetScraper
+
+
 class ContentManager:
     """Gestiona la descarga y limpieza de contenido multimedia multi-plataforma."""
     
@@ -792,10 +1437,16 @@ class ContentManager:
         else:
             self.download_emojis = bool(raw_download_emojis)
         # Permitir override del scripts_twitter_path desde config global
-        if scripts_twitter_path:
-            self.config.setdefault("content", {})["scripts_twitter_path"] = scripts_twitter_path
+        # (sin escribirlo en config: el dict puede estar compartido vía _read_json_cached)
+        self._scripts_twitter_override = scripts_twitter_path
         self.state_file = os.path.join(self.download_base, "content_state.json")
-        self.logger.info(f"Descarga de emojis habilitada: {self.download_emojis}")
+        # Diario de cambios (una línea JSON por alta/baja) que se compacta en state_file
+        self.state_log_file = os.path.join(self.download_base, "content_state.log")
+        self.logger.info("Descarga de emojis habilitada: %s", self.download_emojis)
+        # Descargas simultáneas de URLs nuevas en sync_content
+        self.download_workers = max(1, int(config.get("content", {}).get("download_workers", 4)))
+        self._content_locks: Dict[str, threading.Lock] = {}
+        self._content_locks_guard = threading.Lock()
         
         # Cargar módulo de Twitter dinámicamente
         self.scripts_path = self._resolve_scripts_path()
@@ -806,14 +1457,36 @@ class ContentManager:
         # Asegurar directorio base
         os.makedirs(self.download_base, exist_ok=True)
         
-        # Estado actual {url: tweet_id}
+        # Estado actual {url: tweet_id}: instantánea + diario de cambios pendientes
+        self._state_snapshot_size = 0
+        self._state_snapshot_sig = None
+        self._state_log_size = 0
+        self._state_ops: List[Tuple[str, str, Optional[str]]] = []
+        # URL -> ID. Las claves son las propias URLs: CPython guarda el hash en cada str,
+        # y las URLs vigentes salen de la caché del parser (mismos objetos en cada pasada)
         self.state = self._load_state()
+        self._state_dirty = False
+        self.index_file = os.path.join(self.download_base, "index.csv")
+        self._index_dirty = True  # La primera sincronización siempre escribe el índice
+        self._index_written: Optional[bytes] = None  # Último contenido escrito en index.csv
+        # Al salir se guarda lo pendiente en el diario; solo el monitor (INewsMonitor.run)
+        # consolida la instantánea, con close(compact=True)
+        atexit.register(self._save_state)
+        # IDs cuyo tweet_api.json sabemos que existe (evita un stat por fila del índice)
+        self._json_ok: set = set()
+        self._abs_download_base = os.path.abspath(self.download_base)
+        # Prefijos "<base>/" calculados una vez: las rutas por ID solo concatenan
+        self._base_prefix = os.path.join(self.download_base, "")
+        self._abs_base_prefix = os.path.join(self._abs_download_base, "")
 
     def _resolve_scripts_path(self) -> Optional[str]:
-        scripts_path = self.config.get("content", {}).get("scripts_twitter_path")
+        scripts_path = (
+            self._scripts_twitter_override
+            or self.config.get("content", {}).get("scripts_twitter_path")
+        )
 
         if not scripts_path or not os.path.exists(scripts_path):
-            local_scripts = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ScriptsTwitter")
+            local_scripts = os.path.join(SCRIPT_DIR, "ScriptsTwitter")
             if os.path.exists(local_scripts):
                 self.logger.warning(f"Ruta config no valida ({scripts_path}), usando local: {local_scripts}")
                 scripts_path = local_scripts
@@ -829,7 +1502,7 @@ class ContentManager:
         if not self.scripts_path:
             return None
         try:
-            module = __import__(module_name, fromlist=[class_name])
+            module = _import_script_module(self.scripts_path, module_name)
             return getattr(module, class_name)
         except Exception as e:
             self.logger.error(f"Error importando {class_name} desde {module_name}: {e}")
@@ -841,7 +1514,7 @@ class ContentManager:
         
         # Fallback: intentar buscar ScriptsTwitter en el directorio actual si la config falla
         if not scripts_path or not os.path.exists(scripts_path):
-            local_scripts = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ScriptsTwitter")
+            local_scripts = os.path.join(SCRIPT_DIR, "ScriptsTwitter")
             if os.path.exists(local_scripts):
                 self.logger.warning(f"Ruta config no válida ({scripts_path}), usando local: {local_scripts}")
                 scripts_path = local_scripts
@@ -849,285 +1522,188 @@ class ContentManager:
                 self.logger.error(f"Ruta de scripts Twitter no válida y no hallada localmente: {scripts_path}")
                 return None
             
-        sys.path.append(scripts_path)
         try:
-            if scripts_path not in sys.path:
-                sys.path.append(scripts_path)
-            
-            import scrape_tweet_api
+            scrape_tweet_api = _import_script_module(scripts_path, "scrape_tweet_api")
             print(f"[OK] Motor de descarga Twitter cargado correctamente.")
             
-            # Definir la clase personalizada heredando de la importada
-            class CustomTweetScraper(scrape_tweet_api.TweetScraper):
-                def __init__(self, output_dir: str, download_emojis: bool = True):
-                    """Inicializa sin crear directorios aún (se crean por tweet)."""
-                    self.download_emojis = download_emojis
-                    super().__init__(output_dir)
-                    # No llamar a _setup_directories() aquí para evitar crear
-                    # carpetas innecesarias en la raíz base
-                
-                def _setup_directories(self):
-                    """Crea directorios base, opcionalmente la carpeta de emojis."""
-                    os.makedirs(self.output_dir, exist_ok=True)
-                    os.makedirs(self.temp_folder_video, exist_ok=True)
-                    if self.download_emojis:
-                        os.makedirs(self.emojis_dir, exist_ok=True)
-
-                def get_tweet_data(self, tweet_id: str) -> Dict:
-                    """
-                    Fuerza la solicitud del campo note_tweet para obtener texto completo
-                    en tweets largos (evita truncado en data.text).
-                    """
-                    url = f"https://api.twitter.com/2/tweets/{tweet_id}"
-                    params = {
-                        "expansions": "author_id,attachments.media_keys",
-                        "tweet.fields": "created_at,text,note_tweet",
-                        "user.fields": "name,username,profile_image_url",
-                        "media.fields": "url,type"
-                    }
-                    headers = {"Authorization": f"Bearer {self.bearer_token}"}
-                    response = requests.get(url, params=params, headers=headers)
-                    if response.status_code != 200:
-                        raise Exception(f"Error {response.status_code}: {response.text}")
-                    return response.json()
-
-                def extract_relevant_data(self, json_data: Dict) -> Dict:
-                    """
-                    Mantiene la logica base, pero prioriza note_tweet.text cuando existe.
-                    """
-                    data = super().extract_relevant_data(json_data)
-                    tweet = json_data.get("data", {})
-                    note_tweet = tweet.get("note_tweet", {})
-                    full_text = note_tweet.get("text") if isinstance(note_tweet, dict) else ""
-
-                    if full_text:
-                        text = full_text.strip()
-                        text = re.sub(r'^(?:@\w+\s*)+', '', text).strip()
-                        text = re.sub(r'https://t\.co/\S+', '', text).strip()
-                        text, texto_traducido = self.traducir_texto(text)
-                        data["text"] = text
-                        data["text_traducido"] = texto_traducido
-
-                    return data
-
-                def _parse_fps(self, value: str) -> Optional[float]:
-                    """Convierte un valor de fps tipo '30000/1001' a float."""
-                    if not value:
-                        return None
-                    try:
-                        if "/" in value:
-                            num, den = value.split("/", 1)
-                            den_f = float(den)
-                            if den_f == 0:
-                                return None
-                            return float(num) / den_f
-                        return float(value)
-                    except (ValueError, TypeError):
-                        return None
-
-                def _probe_video(self, input_path: str) -> Tuple[Optional[float], str]:
-                    """Obtiene fps y formato contenedor usando ffprobe."""
-                    try:
-                        result = subprocess.run(
-                            [
-                                "ffprobe",
-                                "-v", "error",
-                                "-select_streams", "v:0",
-                                "-show_entries", "stream=avg_frame_rate,r_frame_rate",
-                                "-show_entries", "format=format_name",
-                                "-of", "json",
-                                input_path
-                            ],
-                            capture_output=True,
-                            text=True,
-                            check=True
-                        )
-                        payload = json.loads(result.stdout or "{}")
-                        stream = (payload.get("streams") or [{}])[0]
-                        format_name = (payload.get("format") or {}).get("format_name", "")
-                        fps_expr = stream.get("avg_frame_rate") or stream.get("r_frame_rate") or ""
-                        fps = self._parse_fps(fps_expr)
-                        return fps, format_name
-                    except Exception as e:
-                        print(f"[i] No se pudo analizar video con ffprobe ({input_path}): {e}")
-                        return None, ""
-
-                def convertir_a_25fps(self, input_path: str, output_path: str) -> bool:
-                    """
-                    Convierte el video a 25 fps solo si es necesario.
-                    Si ya está en MP4 a 25 fps, copia el archivo directamente.
-                    """
-                    try:
-                        subprocess.run(
-                            ["ffmpeg", "-version"],
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.DEVNULL,
-                            check=True
-                        )
-
-                        fps, format_name = self._probe_video(input_path)
-                        is_mp4 = input_path.lower().endswith(".mp4") or ("mp4" in (format_name or "").lower())
-                        if fps is not None and abs(fps - 25.0) < 0.05 and is_mp4:
-                            if os.path.abspath(input_path) != os.path.abspath(output_path):
-                                shutil.copy2(input_path, output_path)
-                            print("[i] Video ya está en MP4 a 25 fps; se omite conversión.")
-                            return True
-
-                        subprocess.run(
-                            ["ffmpeg", "-i", input_path, "-r", "25", "-y", output_path],
-                            check=True,
-                            stdout=subprocess.DEVNULL,
-                            stderr=subprocess.DEVNULL
-                        )
-                        print("[OK] Video convertido a 25 fps.")
-                        return True
-                    except FileNotFoundError:
-                        print("[X] ffmpeg no encontrado en PATH.")
-                        return False
-                    except Exception as e:
-                        print(f"[X] Error al convertir video a 25 fps: {e}")
-                        return False
-
-                def run(self, tweet_url: str):
-                    """Sobrescribe run para personalizar paths y JSON."""
-                    tweet_id = self.extract_tweet_id(tweet_url)
-                    if not tweet_id:
-                        print(f"[X] No se pudo extraer ID")
-                        return
-
-                    try:
-                        # Crear carpeta para este tweet
-                        tweet_dir = os.path.join(self.output_dir, tweet_id)
-                        os.makedirs(tweet_dir, exist_ok=True)
-                        
-                        # Actualizar directorios de salida de la instancia
-                        self.output_dir = tweet_dir  # Base para el JSON
-                        self.output_folder_images = tweet_dir
-                        self.output_folder_media = tweet_dir
-                        self.temp_folder_video = os.path.join(tweet_dir, "TempVideo")
-                        self.emojis_dir = os.path.join(tweet_dir, "Emojis")
-                        self._setup_directories()
-
-                        # --- Lógica original adaptada ---
-                        json_data = self.get_tweet_data(tweet_id)
-                        data = self.extract_relevant_data(json_data)
-
-                        # Rutas absolutas para el JSON
-                        abs_profile = os.path.abspath(os.path.join(tweet_dir, "FotoPerfil.jpg")).replace("\\", "/")
-                        abs_post_img = os.path.abspath(os.path.join(tweet_dir, "FotoPost.jpg")).replace("\\", "/")
-                        abs_video = os.path.abspath(os.path.join(tweet_dir, "VideoPost.mp4")).replace("\\", "/")
-
-                        # Descargar imágenes
-                        if data.get("profile_image"):
-                            self.download_image(data["profile_image"], os.path.join(self.output_folder_images, "FotoPerfil.jpg"))
-                            data["profile_image"] = abs_profile
-                        else:
-                            data["profile_image"] = ""
-
-                        if data.get("tweet_image"):
-                            self.download_image(data["tweet_image"], os.path.join(self.output_folder_images, "FotoPost.jpg"))
-                            data["tweet_image"] = abs_post_img
-                        else:
-                            data["tweet_image"] = ""
-
-                        # Manejo de Video
-                        data["tweet_video"] = "" # Default vacío
-                        
-                        video_original_path = os.path.join(self.temp_folder_video, "VideoOriginal.mp4")
-                        video_final_path = os.path.join(self.output_folder_media, "VideoPost.mp4")
-
-                        # Limpieza previa de video
-                        for path in [video_original_path, video_final_path]:
-                            if os.path.exists(path):
-                                try: os.remove(path)
-                                except: pass
-
-                        if data.get("has_video"):
-                            self.download_video_or_gif(tweet_url)
-                            downloaded_files = os.listdir(self.temp_folder_video)
-                            downloaded_video = next((f for f in downloaded_files if f.startswith("VideoOriginal")), None)
-                            
-                            if downloaded_video:
-                                full_downloaded_path = os.path.join(self.temp_folder_video, downloaded_video)
-                                if self.convertir_a_25fps(full_downloaded_path, video_final_path) and os.path.exists(video_final_path):
-                                    data["tweet_video"] = abs_video
-                                    print(f"[OK] Video guardado: {abs_video}")
-                                else:
-                                    print(f"[X] No se pudo preparar el video final: {video_final_path}")
-
-                        # Eliminar has_video si no se quiere en JSON final o dejarlo
-                        if "has_video" in data: del data["has_video"]
-
-                        # Emojis (Lógica igual, rutas relativas dentro de carpeta tweet)
-                        if self.download_emojis:
-                            text_emojis = self.extract_emojis(data.get("text", ""))
-                            name_emojis = self.extract_emojis(data.get("name", ""))
-                            emojis = list(dict.fromkeys(text_emojis + name_emojis))
-                            emoji_map = {emoji: f"\\oemj {i+1};" for i, emoji in enumerate(emojis)}
-
-                            for idx, emoji_char in enumerate(emojis, start=1):
-                                filename = f"emoji{idx}.png"
-                                filepath = os.path.join(self.emojis_dir, filename)
-                                self.download_emoji(emoji_char, filepath)
-
-                            if "text" in data: data["text"] = self.replace_emojis_with_oemj(data["text"], emoji_map)
-                            if "name" in data: data["name"] = self.replace_emojis_with_oemj(data["name"], emoji_map)
-                            if "text_traducido" in data: data["text_traducido"] = self.replace_emojis_with_oemj(data["text_traducido"], emoji_map)
-
-                        # Guardar JSON
-                        json_path = os.path.join(self.output_dir, "tweet_api.json")
-                        self.save_to_json(data, json_path)
-                        print(f"[OK] JSON guardado en: {json_path}")
-                        
-                        # Limpiar temp video
-                        try: shutil.rmtree(self.temp_folder_video)
-                        except: pass
-
-                        # FINALMENTE: Asegurar permisos para todos los archivos generados
-                        self._grant_permissions(tweet_dir)
-
-                    except Exception as e:
-                        print(f"[X] Error procesando tweet {tweet_id}: {e}")
-                        import traceback
-                        traceback.print_exc()
-
-                def _grant_permissions(self, path: str):
-                    """Otorga control total a Everyone/Todos sobre la carpeta y su contenido."""
-                    try:
-                        # Intentar grupo en Inglés
-                        subprocess.run(['icacls', path, '/grant', 'Everyone:F', '/t', '/c', '/q'], 
-                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                        # Intentar grupo en Español
-                        subprocess.run(['icacls', path, '/grant', 'Todos:F', '/t', '/c', '/q'], 
-                                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                    except Exception as e:
-                        print(f"⚠️ Warning: No se pudieron establecer permisos explícitos: {e}")
-
-            return CustomTweetScraper
+            return _build_custom_tweet_scraper(scrape_tweet_api.TweetScraper)
             
-        except ImportError as e:
+        except (ImportError, FileNotFoundError) as e:
             self.logger.error(f"Error importando scrape_tweet_api: {e}")
             return None
 
     def _load_state(self) -> Dict[str, str]:
-        """Carga el estado de descargas desde JSON."""
+        """Carga el estado de descargas: instantánea JSON + cambios del diario."""
+        state: Dict[str, str] = {}
         if os.path.exists(self.state_file):
             try:
-                with open(self.state_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    raw = f.read()
+                state = orjson.loads(raw) if orjson is not None else json.loads(raw.decode('utf-8'))
+                self._state_snapshot_size = len(raw)
+                self._state_snapshot_sig = self._snapshot_signature()
             except:
                 pass
-        return {}
+        if os.path.exists(self.state_log_file):
+            try:
+                with open(self.state_log_file, 'rb+') as f:
+                    for line in f:
+                        if not line.endswith(b"\n"):
+                            # Última línea a medio escribir (corte de luz, kill): se descarta
+                            # para que el siguiente append empiece en una línea nueva
+                            f.truncate(self._state_log_size)
+                            break
+                        self._state_log_size += len(line)
+                        self._apply_state_op(state, line)
+            except Exception as e:
+                self.logger.error(f"Error leyendo diario de estado: {e}")
+        return state
 
-    def _save_state(self):
-        """Guarda el estado actual."""
+    @staticmethod
+    def _apply_state_op(state: Dict[str, str], line: bytes) -> bool:
         try:
-            with open(self.state_file, 'w', encoding='utf-8') as f:
-                json.dump(self.state, f, indent=2)
+            op = orjson.loads(line) if orjson is not None else json.loads(line)
+        except ValueError:
+            return False
+        if op.get("op") == "set":
+            state[op["url"]] = op["id"]
+        elif op.get("op") == "del":
+            state.pop(op["url"], None)
+        else:
+            return False
+        return True
+
+    def _catch_up_state_log(self, f) -> bool:
+        """
+        Aplica las líneas que otro proceso (scripts de prueba, otra instancia) haya
+        añadido al diario desde la última posición leída por esta instancia.
+        Devuelve False si el diario es más corto de lo leído: otro proceso lo consolidó
+        (se relee entero, ya solo contiene lo posterior a su instantánea).
+        """
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        consolidated = end < self._state_log_size
+        if consolidated:
+            self._state_log_size = 0
+        if end > self._state_log_size:
+            f.seek(self._state_log_size)
+            tail = f.read(end - self._state_log_size)
+            complete = tail[:tail.rfind(b"\n") + 1]
+            for line in complete.splitlines():
+                if self._apply_state_op(self.state, line):
+                    self._index_dirty = True
+            self._state_log_size += len(complete)
+        return not consolidated
+
+    def _set_state(self, url: str, content_id: str):
+        self.state[url] = content_id
+        self._state_ops.append(("set", url, content_id))
+        self._state_dirty = True
+        self._index_dirty = True
+
+    def _drop_state(self, url: str):
+        del self.state[url]
+        self._state_ops.append(("del", url, None))
+        self._state_dirty = True
+        self._index_dirty = True
+
+    def close(self, compact: bool = False):
+        """
+        Guarda lo pendiente y retira el hook de salida. Solo el monitor pide compact
+        al terminar run(); el resto de procesos (scripts, gestores sustituidos por una
+        recarga) se limitan a añadir sus cambios al diario.
+        """
+        atexit.unregister(self._save_state)
+        self._save_state(compact=compact)
+
+    def _save_state(self, compact: bool = False):
+        """
+        Persiste los cambios pendientes: normalmente solo se añaden al diario;
+        la instantánea completa se reescribe cuando el diario crece más que ella,
+        si el estado se modificó sin pasar por _set_state/_drop_state, o si se
+        pide compact (al cerrar el monitor) y hay diario que consolidar.
+        """
+        if not self._state_dirty and not (compact and self._state_log_size):
+            return
+        try:
+            compact = (
+                compact
+                or not self._state_ops
+                or self._state_log_size > max(64 * 1024, 2 * self._state_snapshot_size)
+            )
+            if not (compact and self._write_state_snapshot()):
+                if not self._state_ops:
+                    # Otro proceso acaba de consolidar: se reintenta en el próximo guardado
+                    return
+                self._append_state_log()
+            self._state_ops = []
+            self._state_dirty = False
         except Exception as e:
             self.logger.error(f"Error guardando estado: {e}")
 
-    def _detect_platform(self, url: str) -> Optional[str]:
+    def _append_state_log(self):
+        lines = []
+        for op, url, content_id in self._state_ops:
+            entry = {"op": op, "url": url}
+            if content_id is not None:
+                entry["id"] = content_id
+            lines.append(orjson.dumps(entry) if orjson is not None else json.dumps(entry).encode('utf-8'))
+        data = b"\n".join(lines) + b"\n"
+        with open(self.state_log_file, 'a+b') as f:
+            # Lo añadido por otros procesos se incorpora antes; así la posición
+            # leída sigue coincidiendo con el final del diario tras escribir
+            self._catch_up_state_log(f)
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+            self._state_log_size = f.tell()
+
+    def _write_state_snapshot(self) -> bool:
+        """
+        Reescribe la instantánea y vacía el diario. El diario solo se trunca si esta
+        instancia ha leído hasta su final: lo que otro proceso añada entretanto se
+        queda y se vuelve a aplicar al cargar (reaplicar el diario es inocuo).
+        Devuelve False (sin escribir) si otro proceso consolidó el diario antes.
+        """
+        if self._snapshot_signature() != self._state_snapshot_sig:
+            # La instantánea en disco no es la que se cargó: reescribirla perdería lo ajeno
+            return False
+        log = open(self.state_log_file, 'a+b') if os.path.exists(self.state_log_file) else None
+        try:
+            if log is not None and not self._catch_up_state_log(log):
+                return False
+            self._write_state_snapshot_file()
+            if log is not None:
+                log.seek(0, os.SEEK_END)
+                if log.tell() == self._state_log_size:
+                    log.truncate(0)
+                    self._state_log_size = 0
+            return True
+        finally:
+            if log is not None:
+                log.close()
+
+    def _write_state_snapshot_file(self):
+        if orjson is not None:
+            data = orjson.dumps(self.state, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.state, indent=2).encode('utf-8')
+        tmp_path = self.state_file + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, self.state_file)
+        self._state_snapshot_size = len(data)
+        self._state_snapshot_sig = self._snapshot_signature()
+
+    def _snapshot_signature(self) -> Optional[tuple]:
+        try:
+            st = os.stat(self.state_file)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    @staticmethod
+    def _detect_platform(url: str) -> Optional[str]:
         domain = urlparse(url).netloc.lower()
         if "x.com" in domain or "twitter.com" in domain:
             return "twitter"
@@ -1139,147 +1715,231 @@ class ContentManager:
 
     @staticmethod
     def _safe_id(value: str) -> str:
-        return re.sub(r'[^A-Za-z0-9_.-]+', '_', value or "")
+        return _RE_UNSAFE_ID.sub('_', value or "")
 
-    def _extract_content_id(self, url: str, platform: str) -> Optional[str]:
+    @staticmethod
+    def _extract_content_id(url: str, platform: str) -> Optional[str]:
         if platform == "twitter":
-            match = re.search(r'/status/(\d+)', url)
+            match = _RE_TWITTER_ID.search(url)
             return match.group(1) if match else None
 
         if platform == "bluesky":
-            match = re.search(r'bsky\.app/profile/([^/]+)/post/([^/?#]+)', url, re.IGNORECASE)
+            match = _RE_BLUESKY_ID.search(url)
             if not match:
                 return None
-            handle = self._safe_id(match.group(1))
-            post_id = self._safe_id(match.group(2))
+            handle = ContentManager._safe_id(match.group(1))
+            post_id = ContentManager._safe_id(match.group(2))
             return f"bsky_{handle}_{post_id}"
 
         if platform == "truth":
-            match = re.search(r'truthsocial\.com/@[^/]+/posts/(\d+)', url, re.IGNORECASE)
+            match = _RE_TRUTH_ID.search(url)
             return f"truth_{match.group(1)}" if match else None
 
         return None
 
     def _get_json_path_for_id(self, content_id: str) -> str:
-        return os.path.join(self.download_base, content_id, "tweet_api.json")
+        return f"{self._base_prefix}{content_id}{os.sep}tweet_api.json"
 
-    def sync_content(self, current_urls: List[str], clean: bool = True):
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _content_key(url: str) -> Tuple[Optional[str], Optional[str]]:
+        """(plataforma, id) de una URL; cacheado porque las descargas fallidas se reintentan cada pasada."""
+        platform = ContentManager._detect_platform(url)
+        if not platform:
+            return None, None
+        return platform, ContentManager._extract_content_id(url, platform)
+
+    def _download_url(self, url: str) -> Optional[str]:
+        """Descarga el contenido de una URL; devuelve su ID si se generó el JSON."""
+        try:
+            platform, content_id = self._content_key(url)
+            if not platform:
+                self.logger.warning(f"URL con dominio no soportado: {url}")
+                return None
+
+            if not content_id:
+                self.logger.warning(f"URL inválida (no se pudo extraer ID): {url}")
+                return None
+            self.logger.info("Descargando contenido para: %s", url)
+            with self._content_lock(content_id):
+                return self._run_scraper(url, platform, content_id)
+        except Exception as e:
+            self.logger.error(f"Error descargando {url}: {e}")
+        return None
+
+    def _content_lock(self, content_id: str) -> threading.Lock:
+        """Lock por ID: dos URLs del mismo contenido no escriben la carpeta a la vez."""
+        with self._content_locks_guard:
+            return self._content_locks.setdefault(content_id, threading.Lock())
+
+    def _run_scraper(self, url: str, platform: str, content_id: str) -> Optional[str]:
+        """Ejecuta el scraper de la plataforma; devuelve el ID si se generó el JSON."""
+        if platform == "twitter":
+            if not self.tweet_scraper_class:
+                self.logger.error("Scraper de Twitter no cargado.")
+                return None
+            scraper = self.tweet_scraper_class(
+                output_dir=self.download_base,
+                download_emojis=self.download_emojis
+            )
+            scraper.run(url)
+        elif platform == "bluesky":
+            if not self.bluesky_scraper_class:
+                self.logger.error("Scraper de Bluesky no cargado.")
+                return None
+            target_dir = os.path.join(self.download_base, content_id)
+            try:
+                scraper = self.bluesky_scraper_class(
+                    output_dir=target_dir,
+                    download_emojis=self.download_emojis
+                )
+            except TypeError:
+                # Compatibilidad con versiones antiguas del scraper.
+                scraper = self.bluesky_scraper_class(output_dir=target_dir)
+            scraper.run(url)
+        else:
+            if not self.truth_scraper_class:
+                self.logger.error("Scraper de Truth Social no cargado.")
+                return None
+            target_dir = os.path.join(self.download_base, content_id)
+            try:
+                scraper = self.truth_scraper_class(
+                    output_dir=target_dir,
+                    download_emojis=self.download_emojis
+                )
+            except TypeError:
+                # Compatibilidad con versiones antiguas del scraper.
+                scraper = self.truth_scraper_class(output_dir=target_dir)
+            scraper.run(url)
+
+        if os.path.exists(self._get_json_path_for_id(content_id)):
+            return content_id
+        self.logger.warning(f"No se generó tweet_api.json para {url} (id={content_id})")
+        return None
+
+    def has_pending(self, urls: frozenset) -> bool:
+        """True si alguna URL vigente aún no tiene contenido descargado."""
+        return not urls <= self.state.keys()
+
+    def sync_content(self, current_urls: Iterable[str], clean: bool = True):
         """Sincroniza el contenido: descarga nuevos, borra obsoletos si clean=True."""
-        current_set = set(current_urls)
-        known_set = set(self.state.keys())
+        # Un set/frozenset (caso de ProfileRunner) se usa tal cual, sin copiarlo
+        current_set = current_urls if isinstance(current_urls, (set, frozenset)) else set(current_urls)
 
-        # Identificar nuevos y obsoletos
-        new_urls = current_set - known_set
-        obsolete_urls = known_set - current_set
+        # Identificar nuevos y obsoletos (las vistas de claves operan como sets)
+        new_urls = current_set.difference(self.state)
+        obsolete_urls = self.state.keys() - current_set
 
         # Procesar NUEVOS
         if new_urls:
-            self.logger.info(f"Detectadas {len(new_urls)} URLs nuevas para descargar.")
+            self.logger.info("Detectadas %d URLs nuevas para descargar.", len(new_urls))
             
+            # Varias URLs del mismo contenido (x.com/twitter.com, ?s=20...) se descargan
+            # una sola vez; si ese contenido ya está en disco solo se anotan
+            groups: Dict[Any, List[str]] = {}
             for url in new_urls:
-                try:
-                    platform = self._detect_platform(url)
-                    if not platform:
-                        self.logger.warning(f"URL con dominio no soportado: {url}")
-                        continue
-
-                    content_id = self._extract_content_id(url, platform)
-                    if not content_id:
-                        self.logger.warning(f"URL inválida (no se pudo extraer ID): {url}")
-                        continue
-                    self.logger.info(f"Descargando contenido para: {url}")
-                    if platform == "twitter":
-                        if not self.tweet_scraper_class:
-                            self.logger.error("Scraper de Twitter no cargado.")
-                            continue
-                        scraper = self.tweet_scraper_class(
-                            output_dir=self.download_base,
-                            download_emojis=self.download_emojis
-                        )
-                        scraper.run(url)
-                    elif platform == "bluesky":
-                        if not self.bluesky_scraper_class:
-                            self.logger.error("Scraper de Bluesky no cargado.")
-                            continue
-                        target_dir = os.path.join(self.download_base, content_id)
-                        try:
-                            scraper = self.bluesky_scraper_class(
-                                output_dir=target_dir,
-                                download_emojis=self.download_emojis
-                            )
-                        except TypeError:
-                            # Compatibilidad con versiones antiguas del scraper.
-                            scraper = self.bluesky_scraper_class(output_dir=target_dir)
-                        scraper.run(url)
-                    else:
-                        if not self.truth_scraper_class:
-                            self.logger.error("Scraper de Truth Social no cargado.")
-                            continue
-                        target_dir = os.path.join(self.download_base, content_id)
-                        try:
-                            scraper = self.truth_scraper_class(
-                                output_dir=target_dir,
-                                download_emojis=self.download_emojis
-                            )
-                        except TypeError:
-                            # Compatibilidad con versiones antiguas del scraper.
-                            scraper = self.truth_scraper_class(output_dir=target_dir)
-                        scraper.run(url)
-
-                    if os.path.exists(self._get_json_path_for_id(content_id)):
-                        self.state[url] = content_id
-                        self._save_state()
-                    else:
-                        self.logger.warning(f"No se generó tweet_api.json para {url} (id={content_id})")
-                except Exception as e:
-                    self.logger.error(f"Error descargando {url}: {e}")
+                content_id = self._content_key(url)[1]
+                if content_id and content_id in self._json_ok:
+                    self._set_state(url, content_id)
+                    continue
+                groups.setdefault(self._content_key(url) if content_id else url, []).append(url)
+            
+            if groups:
+                workers = min(self.download_workers, len(groups))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(self._download_url, urls[0]): urls
+                        for urls in groups.values()
+                    }
+                    for future in as_completed(futures):
+                        content_id = future.result()
+                        if content_id:
+                            # El estado solo se modifica desde este hilo
+                            for url in futures[future]:
+                                self._set_state(url, content_id)
+                            self._json_ok.add(content_id)
+            self._save_state()
 
         # Procesar OBSOLETOS (Sólo si clean es True)
         if clean and obsolete_urls:
-            self.logger.info(f"Detectadas {len(obsolete_urls)} URLs obsoletas. Limpiando...")
+            self.logger.info("Detectadas %d URLs obsoletas. Limpiando...", len(obsolete_urls))
+            # Carpetas que siguen en uso por otra URL vigente del mismo contenido
+            kept_ids = {self.state[url] for url in self.state.keys() - obsolete_urls}
             for url in obsolete_urls:
                 tweet_id = self.state.get(url)
-                if tweet_id:
+                if tweet_id and tweet_id not in kept_ids:
                     folder_path = os.path.join(self.download_base, tweet_id)
                     if os.path.exists(folder_path):
                         try:
-                            self.logger.info(f"Eliminando carpeta obsoleta: {folder_path}")
+                            self.logger.info("Eliminando carpeta obsoleta: %s", folder_path)
                             if not _robust_rmtree(folder_path, self.logger):
                                 self.logger.error(f"No se pudo eliminar carpeta {folder_path}")
                         except Exception as e:
                             self.logger.error(f"Error eliminando carpeta {folder_path}: {e}")
+                    self._json_ok.discard(tweet_id)
                 
-                del self.state[url]
-                self._save_state()
+                self._drop_state(url)
+            self._save_state()
         elif obsolete_urls:
-            self.logger.info(f"Detectadas {len(obsolete_urls)} URLs obsoletas (Limpieza PENDIENTE).")
+            self.logger.info("Detectadas %d URLs obsoletas (Limpieza PENDIENTE).", len(obsolete_urls))
         
-        # Siempre actualizar el índice maestro al final de la sincronización
-        self._update_index()
+        # El índice maestro solo se reescribe si cambió el estado (o si lo han borrado)
+        if self._index_dirty or not os.path.exists(self.index_file):
+            self._update_index()
 
     def _update_index(self):
         """Genera/Actualiza el archivo index.csv con el mapeo URL -> Ruta Local JSON."""
-        index_file = os.path.join(self.download_base, "index.csv")
+        index_file = self.index_file
         
         try:
-            with open(index_file, "w", encoding="utf-8", newline="") as f:
-                writer = csv.writer(f, delimiter=";")
-                # Escribir encabezado
-                writer.writerow(["URL", "RUTA LOCAL"])
-                
-                # Escribir datos
-                for url, tweet_id in self.state.items():
-                    # Construir ruta absoluta al tweet_api.json
-                    json_path = os.path.join(self.download_base, tweet_id, "tweet_api.json")
-                    abs_json_path = os.path.abspath(json_path)
-                    
-                    # Verificar si existe para no meter basura (opcional, pero recomendable)
-                    if os.path.exists(json_path):
-                        # Usar el directorio padre (carpeta del tweet) en lugar del archivo json
-                        abs_folder_path = os.path.dirname(abs_json_path)
-                        writer.writerow([url, abs_folder_path])
+            # Se compone en memoria y se escribe de una vez; csv.writer solo se usa
+            # para las filas raras que necesitan comillas
+            buf = StringIO()
+            writer = csv.writer(buf, delimiter=";")
+            # Escribir encabezado
+            buf.write("URL;RUTA LOCAL\r\n")
+            
+            # IDs aún no verificados en esta ejecución (p.ej. los del estado al arrancar):
+            # un único scandir de la carpeta base descarta los que ya no tienen carpeta
+            present_dirs = None
+            if any(tweet_id not in self._json_ok for tweet_id in self.state.values()):
+                with os.scandir(self.download_base) as it:
+                    present_dirs = {entry.name for entry in it if entry.is_dir()}
             
-            self.logger.info(f"Índice maestro actualizado: {index_file}")
+            base_prefix = self._abs_base_prefix
+            
+            # Escribir datos
+            for url, tweet_id in self.state.items():
+                # Verificar si existe para no meter basura; solo se consulta el disco
+                # para IDs que aún no se han visto en esta ejecución
+                if tweet_id not in self._json_ok:
+                    if present_dirs is not None and tweet_id not in present_dirs:
+                        continue
+                    if not os.path.exists(self._get_json_path_for_id(tweet_id)):
+                        continue
+                    self._json_ok.add(tweet_id)
+                # Usar la carpeta del tweet en lugar del archivo json
+                folder = base_prefix + tweet_id
+                if _RE_CSV_SPECIAL.search(url) or _RE_CSV_SPECIAL.search(folder):
+                    writer.writerow([url, folder])
+                else:
+                    buf.write(f"{url};{folder}\r\n")
+            
+            data = buf.getvalue().encode("utf-8")
+            if data == self._index_written and os.path.exists(index_file):
+                # Altas y bajas que se compensan: el índice del share ya está al día
+                self._index_dirty = False
+                return
+            
+            # Temporal + os.replace: quien lea el índice por SMB nunca ve un CSV a medias
+            tmp_path = index_file + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, index_file)
+            self._index_written = data
+            
+            self._index_dirty = False
+            self.logger.info("Índice maestro actualizado: %s", index_file)
         except Exception as e:
             self.logger.error(f"Error actualizando índice maestro: {e}")
 
@@ -1295,6 +1955,11 @@ class RundownWatcher:
         self.base_interval = max(1, int(config.get("interval_seconds", 30)))
         self.interval = self.base_interval
         self.ap_filter = config.get("ap_filter", "")
+        # Tupla: clave de caché directa para _tipos_lower y _story_info_cached
+        self.tipos_validos: Tuple[str, ...] = tuple(config.get("tipos_validos") or StoryParser.TIPOS_VALIDOS)
+        if isinstance(self.ap_filter, list):
+            # Lista de filtros: tupla para que la regex combinada se cachee
+            self.ap_filter = tuple(self.ap_filter)
         self.ftp_pool = ftp_pool
         self.assigned_host = (
             config.get("assigned_inews_host")
@@ -1303,6 +1968,13 @@ class RundownWatcher:
             or ftp_pool.choose_host(f"{name}:{self.path}")
         )
         self.metadata_cache_enabled = bool(config.get("metadata_cache", True))
+        # Conexiones simultáneas (incluida la propia) para leer historias; las extra
+        # solo se toman si el pool tiene capacidad libre en ese momento
+        self.fetch_workers = max(1, int(config.get("fetch_workers", 4)))
+        # Prefiltros opcionales antes del RETR: nombre de story y tamaño informado por el servidor
+        raw_name_regex = config.get("story_name_regex")
+        self.story_name_filter = re.compile(raw_name_regex) if raw_name_regex else None
+        self.min_story_bytes = max(0, int(config.get("min_story_bytes", 0)))
         self.story_cache: Dict[str, Dict[str, Any]] = {}
         self.idle_runs = 0
         self.adaptive_polling = bool(config.get("adaptive_polling", True))
@@ -1317,16 +1989,70 @@ class RundownWatcher:
         
         # Cada watcher tiene su propia conexión FTP independiente
         self.last_run_time = 0
-        self.last_entries: Dict[str, str] = {}  # entry_name -> hash
-        self.active_urls: List[str] = [] # URLs encontradas en la última pasada exitosa
+        state_dir = config.get("state_dir")
+        safe_name = _RE_UNSAFE_NAME.sub('_', name)
+        self._entries_state_path = (
+            os.path.join(state_dir, f".watcher_{safe_name}.json") if state_dir else None
+        )
+        self.last_entries: Dict[str, str] = self._load_entries_state()  # entry_name -> hash
+        self._entries_dirty = False
+        self.last_info: Dict[str, Dict] = {}  # entry_name -> info del último parseo (al menos "urls")
+        self.unmatched_hashes: Dict[str, str] = {}  # entry_name -> hash del contenido que no pasó el filtro
+        self.active_urls: frozenset = frozenset()  # URLs encontradas en la última pasada exitosa
         self.has_run = False # Indica si el watcher ha completado al menos una ejecución
         self.logger = logging.getLogger(f"Watcher_{name}")
         self._lock = threading.Lock()  # Protege acceso concurrente al estado del watcher
-        self.logger.info(f"Watcher {self.name} asignado a iNews FTP {self.assigned_host}")
+        self.logger.info("Watcher %s asignado a iNews FTP %s", self.name, self.assigned_host)
+
+    @staticmethod
+    def _content_hash(content: str) -> str:
+        """
+        Huella estable del contenido (no depende de PYTHONHASHSEED). Se persiste en
+        .watcher_*.json, así que no depende de paquetes opcionales: cambiar de
+        algoritmo haría que todas las historias pareciesen nuevas tras reiniciar.
+        La comparación por pasada es de 8 bytes; no se buscan bloques cambiados
+        dentro de la historia porque una historia modificada se vuelve a parsear entera.
+        """
+        return hashlib.blake2b(content.encode('utf-8', 'replace'), digest_size=8).hexdigest()
+
+    def _load_entries_state(self) -> Dict[str, str]:
+        """Recupera las huellas de la última ejecución para no reemitir historias tras reiniciar."""
+        if not self._entries_state_path or not os.path.exists(self._entries_state_path):
+            return {}
+        try:
+            with open(self._entries_state_path, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode('utf-8'))
+            return {str(k): str(v) for k, v in data.items()} if isinstance(data, dict) else {}
+        except Exception as e:
+            logging.getLogger(f"Watcher_{self.name}").warning(f"No se pudo leer estado de entradas: {e}")
+            return {}
+
+    def _save_entries_state(self):
+        """Persiste last_entries si cambió en esta pasada."""
+        if not self._entries_dirty or not self._entries_state_path:
+            return
+        try:
+            if orjson is not None:
+                data = orjson.dumps(self.last_entries)
+            else:
+                data = json.dumps(self.last_entries).encode('utf-8')
+            tmp_path = self._entries_state_path + ".tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self._entries_state_path)
+            self._entries_dirty = False
+        except Exception as e:
+            self.logger.error(f"Error guardando estado de entradas: {e}")
+
+    @property
+    def next_due_at(self) -> float:
+        """Instante (time.time()) en que este monitor vuelve a tocar."""
+        return self.last_run_time + self.interval
 
     def is_due(self) -> bool:
         """Verifica si es hora de ejecutar este monitor."""
-        return (time.time() - self.last_run_time) >= self.interval
+        return time.time() >= self.next_due_at
 
     def disconnect(self):
         """Cierra la conexión FTP de este watcher."""
@@ -1335,7 +2061,12 @@ class RundownWatcher:
     def process(self) -> List[Dict]:
         try:
             with self.ftp_pool.acquire(self.assigned_host) as connection:
-                return self._process_with_connection(connection)
+                try:
+                    return self._process_with_connection(connection)
+                except (OSError, EOFError, ftplib.error_temp, ftplib.error_reply):
+                    # La sesión vuelve al pool: que se compruebe antes de reutilizarla
+                    connection.invalidate()
+                    raise
         except TimeoutError as e:
             self.logger.error(f"No se pudo obtener conexiÃ³n FTP para {self.name}: {e}")
             return []
@@ -1348,7 +2079,7 @@ class RundownWatcher:
         
         Cada watcher navega con su propia conexión, permitiendo ejecución en paralelo.
         """
-        self.logger.info(f"Ejecutando revisión para {self.name}...")
+        self.logger.info("Ejecutando revisión para %s...", self.name)
         self.last_run_time = time.time()
         
         # Asegurar conexión y navegar al directorio correcto
@@ -1362,24 +2093,30 @@ class RundownWatcher:
         
         story_names = connection.list_story_names(self.path)
         if not story_names:
-            self.logger.warning(f"No se encontraron stories o error al listar {self.path}")
+            self.logger.warning("No se encontraron stories o error al listar %s", self.path)
             # Si falla, no limpiamos active_urls para evitar borrar contenido por error de red
             return []
 
         directory_metadata = connection.list_story_metadata(self.path) if self.metadata_cache_enabled else {}
         
-        if self.debug_parser:
+        # Diagnóstico del parser solo si además el nivel INFO llega a algún handler:
+        # así no se construyen los mensajes por historia cuando nadie los va a ver
+        debug_parser = self.debug_parser and self.logger.isEnabledFor(logging.INFO)
+        if debug_parser:
             preview = ", ".join(story_names[:15])
             self.logger.info(
-                f"[DEBUG_PARSER] stories_listadas={len(story_names)} "
-                f"primeras={preview if preview else '-'}"
+                "[DEBUG_PARSER] stories_listadas=%d primeras=%s",
+                len(story_names), preview if preview else '-'
             )
         
         filtered_results = []
-        current_urls = []
+        current_urls: set = set()  # Sin duplicados aunque la URL aparezca en varias historias
+        batch_ts = datetime.now().isoformat()  # Una marca de tiempo por pasada
         scanned_count = 0
         matched_count = 0
         valid_story_names = set()
+        candidates: List[str] = []
+        plan: List[Tuple[str, Optional[Dict[str, str]], bool]] = []
         
         # Nombres especiales de iNews que no son stories válidas
         INVALID_STORY_NAMES = {'ibc', 'data', 'metadata', 'locator', 'info'}
@@ -1403,12 +2140,12 @@ class RundownWatcher:
                 return False
             
             # Patrones linX (lin1, lin2, etc.)
-            if re.match(r'^lin\d+$', name.lower()):
+            if _RE_LIN_NAME.match(name.lower()):
                 return False
             
             # Nombres con caracteres no alfanuméricos (como '???')
             # Las stories válidas suelen ser alfanuméricas con guiones/underscores/dos puntos
-            if not re.search(r'[A-Za-z0-9]', name):
+            if not _RE_ALNUM.search(name):
                 return False
             
             
@@ -1423,24 +2160,67 @@ class RundownWatcher:
             # Filtrar entradas que no son stories válidas
             if not is_valid_story_name(entry_name):
                 continue
+            if self.story_name_filter is not None and not self.story_name_filter.search(entry_name):
+                continue
             valid_story_names.add(entry_name)
-
+            candidates.append(entry_name)
+
+        # Metadatos que el listado del directorio no trajo: MDTM/SIZE en paralelo
+        if self.metadata_cache_enabled:
+            missing = [name for name in candidates if not directory_metadata.get(name)]
+            if missing:
+                directory_metadata = dict(directory_metadata)
+                directory_metadata.update(self._map_over_connections(
+                    connection, missing, lambda conn, name: conn.get_story_metadata(name)
+                ))
+
+        for entry_name in candidates:
             metadata = directory_metadata.get(entry_name)
-            if self.metadata_cache_enabled and not metadata:
-                metadata = connection.get_story_metadata(entry_name)
+            if self.min_story_bytes:
+                size = self._reported_size(metadata)
+                if size is not None and size < self.min_story_bytes:
+                    continue
             cached = self.story_cache.get(entry_name)
-            if metadata and cached and cached.get("metadata") == metadata:
+            cache_hit = bool(metadata and cached and cached.get("metadata") == metadata)
+            plan.append((entry_name, metadata, cache_hit))
+
+        # Descargar en paralelo solo las historias que no están en caché
+        contents = self._read_stories(connection, [name for name, _, hit in plan if not hit])
+
+        for entry_name, metadata, cache_hit in plan:
+            if cache_hit:
+                cached = self.story_cache[entry_name]
                 if cached.get("matched"):
                     matched_count += 1
-                    current_urls.extend(cached.get("urls", []))
+                    current_urls.update(cached.get("urls", []))
                 continue
             
-            content = connection.read_story(entry_name)
+            content, content_hash = contents.get(entry_name) or (None, None)
             if not content:
                 continue
             
-            # Filtros
-            if not StoryParser.matches_ap_filter(content, self.ap_filter):
+            # Historia sin cambios desde el último parseo: reutilizar su info
+            previous_hash = self.last_entries.get(entry_name)
+            previous_info = self.last_info.get(entry_name)
+            if previous_hash == content_hash and previous_info is not None:
+                matched_count += 1
+                story_urls = previous_info.get('urls', [])
+                current_urls.update(story_urls)
+                if metadata:
+                    self.story_cache[entry_name] = {
+                        "metadata": metadata,
+                        "matched": True,
+                        "urls": story_urls,
+                        "content_hash": content_hash
+                    }
+                continue
+            
+            # Filtros (se omiten si el mismo contenido ya no pasó el filtro antes)
+            if (
+                self.unmatched_hashes.get(entry_name) == content_hash
+                or not StoryParser.matches_ap_filter(content, self.ap_filter, self.tipos_validos)
+            ):
+                self.unmatched_hashes[entry_name] = content_hash
                 if metadata:
                     self.story_cache[entry_name] = {
                         "metadata": metadata,
@@ -1449,37 +2229,52 @@ class RundownWatcher:
                     }
                 continue
             matched_count += 1
+            self.unmatched_hashes.pop(entry_name, None)
+            
+            if previous_hash == content_hash:
+                # Ya emitida (p.ej. antes de reiniciar): solo hacen falta sus URLs
+                story_urls = StoryParser.extract_social_urls(content, self.tipos_validos)
+                current_urls.update(story_urls)
+                self.last_info[entry_name] = {"urls": story_urls}
+                if metadata:
+                    self.story_cache[entry_name] = {
+                        "metadata": metadata,
+                        "matched": True,
+                        "urls": story_urls,
+                        "content_hash": content_hash
+                    }
+                continue
                 
-            story_info = StoryParser.extract_story_info(content)
+            story_info = _story_info_cached(
+                content_hash, self.tipos_validos, content
+            )
             story_urls = story_info.get('urls', [])
-            if self.debug_parser:
-                urls = story_info.get("urls", [])
-                preview = ", ".join(urls[:6]) if urls else "-"
+            if debug_parser:
+                preview = ", ".join(story_urls[:6]) if story_urls else "-"
                 self.logger.info(
-                    f"[DEBUG_PARSER] {entry_name} ap_tags={len(story_info.get('ap_tags', []))} "
-                    f"rotulos={len(story_info.get('rotulos', []))} "
-                    f"rotulos_filtrados={len(story_info.get('rotulos_filtrados', []))} "
-                    f"urls={len(urls)} -> {preview}"
+                    "[DEBUG_PARSER] %s ap_tags=%d rotulos=%d rotulos_filtrados=%d urls=%d -> %s",
+                    entry_name, len(story_info.get('ap_tags', [])),
+                    len(story_info.get('rotulos', [])),
+                    len(story_info.get('rotulos_filtrados', [])),
+                    len(story_urls), preview
                 )
             
             # Recolectar URLs (de todas las historias válidas)
-            current_urls.extend(story_urls)
+            current_urls.update(story_urls)
             
-            # Detectar cambios
-            content_hash = hash(content)
-            previous_hash = self.last_entries.get(entry_name)
+            # Historia nueva o modificada
+            self.last_info[entry_name] = story_info
+            self.last_entries[entry_name] = content_hash
+            self._entries_dirty = True
             
-            if previous_hash != content_hash:
-                self.last_entries[entry_name] = content_hash
-                
-                result = {
-                    "entry_name": entry_name,
-                    "content": content,
-                    "info": story_info,
-                    "timestamp": datetime.now().isoformat(),
-                    "watcher_name": self.name
-                }
-                filtered_results.append(result)
+            result = {
+                "entry_name": entry_name,
+                "content": content,
+                "info": story_info,
+                "timestamp": batch_ts,
+                "watcher_name": self.name
+            }
+            filtered_results.append(result)
 
             if metadata:
                 self.story_cache[entry_name] = {
@@ -1489,10 +2284,11 @@ class RundownWatcher:
                     "content_hash": content_hash
                 }
 
-        if self.debug_parser:
+        if debug_parser:
             self.logger.info(
-                f"[DEBUG_PARSER] resumen stories_escaneadas={scanned_count} "
-                f"stories_con_match={matched_count} urls_totales={len(current_urls)}"
+                "[DEBUG_PARSER] resumen stories_escaneadas=%d stories_leidas=%d "
+                "stories_con_match=%d urls_totales=%d",
+                scanned_count, len(contents), matched_count, len(current_urls)
             )
         
         self.story_cache = {
@@ -1500,18 +2296,114 @@ class RundownWatcher:
             for name, cached in self.story_cache.items()
             if name in valid_story_names
         }
-        self.active_urls = current_urls
+        # Olvidar historias que ya no están en el minutado (sus URLs salen de
+        # active_urls y sync_content retira el contenido asociado)
+        removed = [name for name in self.last_entries if name not in valid_story_names]
+        if removed:
+            self.logger.info("%d historias eliminadas de %s", len(removed), self.name)
+            for stale in removed:
+                del self.last_entries[stale]
+            self._entries_dirty = True
+        for stale in [name for name in self.last_info if name not in valid_story_names]:
+            del self.last_info[stale]
+        for stale in [name for name in self.unmatched_hashes if name not in valid_story_names]:
+            del self.unmatched_hashes[stale]
+        self._save_entries_state()
+        self.active_urls = frozenset(current_urls)
         self.has_run = True
         self._update_adaptive_interval(len(filtered_results))
         return filtered_results
 
+    @staticmethod
+    def _reported_size(metadata: Optional[Dict[str, str]]) -> Optional[int]:
+        """Tamaño según MLSD ("1234") o la respuesta de SIZE ("213 1234"); None si no se conoce."""
+        raw = (metadata or {}).get("size") or ""
+        digits = raw.rsplit(None, 1)[-1] if raw.strip() else ""
+        return int(digits) if digits.isdigit() else None
+
+    def _read_stories(self, connection: INewsConnection,
+                      names: List[str]) -> Dict[str, Tuple[Optional[str], Optional[str]]]:
+        """
+        Lee varias historias en paralelo (ver _map_over_connections) y devuelve
+        nombre -> (contenido, huella). La huella se calcula en el mismo hilo que
+        leyó la historia: blake2b suelta el GIL y se solapa con el resto de lecturas.
+        """
+        def fetch(conn: INewsConnection, name: str) -> Tuple[Optional[str], Optional[str]]:
+            content = conn.read_story(name)
+            return content, (self._content_hash(content) if content else None)
+
+        return self._map_over_connections(connection, names, fetch)
+
+    def _map_over_connections(self, connection: INewsConnection, names: List[str],
+                              fetch: Callable[[INewsConnection, str], Any]) -> Dict[str, Any]:
+        """
+        Aplica fetch(conexión, nombre) a cada historia repartiéndolas entre la
+        conexión del watcher y conexiones extra del pool que estén libres en este momento.
+        Cada hilo usa su propia conexión (el canal de control FTP no es thread-safe).
+        """
+        if self.fetch_workers <= 1 or len(names) < 2:
+            return {name: fetch(connection, name) for name in names}
+
+        leases: List[INewsConnectionLease] = []
+        for _ in range(min(self.fetch_workers, len(names)) - 1):
+            lease = self.ftp_pool.try_acquire_extra(self.assigned_host)
+            if lease is None:
+                break
+            leases.append(lease)
+
+        released: Set[INewsConnection] = set()
+        try:
+            connections = [connection]
+            for lease in leases:
+                extra = lease.connection
+                if extra.ensure_connected() and extra.navigate_to(self.path):
+                    connections.append(extra)
+
+            if len(connections) == 1:
+                return {name: fetch(connection, name) for name in names}
+
+            # Cola compartida: cada conexión toma la siguiente historia al quedar libre,
+            # así una story grande o una conexión lenta no retrasan un lote fijo
+            pending: "queue.SimpleQueue[str]" = queue.SimpleQueue()
+            for name in names:
+                pending.put(name)
+
+            def drain(conn: INewsConnection) -> List[Tuple[str, Any]]:
+                read = []
+                try:
+                    while True:
+                        # Las conexiones extra dejan de tomar historias si otro watcher
+                        # espera sesión; la propia termina lo que quede en la cola
+                        if conn is not connection and self.ftp_pool.has_waiters():
+                            return read
+                        try:
+                            name = pending.get_nowait()
+                        except queue.Empty:
+                            return read
+                        read.append((name, fetch(conn, name)))
+                finally:
+                    # Cada extra vuelve al pool en cuanto termina, sin esperar al resto
+                    if conn is not connection:
+                        released.add(conn)
+                        self.ftp_pool.release(conn)
+
+            contents: Dict[str, Any] = {}
+            with ThreadPoolExecutor(max_workers=len(connections)) as executor:
+                for result in executor.map(drain, connections):
+                    contents.update(result)
+            return contents
+        finally:
+            for lease in leases:
+                if lease.connection not in released:
+                    self.ftp_pool.release(lease.connection)
+
     def _update_adaptive_interval(self, changes_count: int):
         if not self.adaptive_polling:
             return
 
         if changes_count > 0:
             if self.interval != self.base_interval:
-                self.logger.info(f"Actividad detectada en {self.name}; intervalo restaurado a {self.base_interval}s")
+                self.logger.info("Actividad detectada en %s; intervalo restaurado a %ss", self.name, self.base_interval)
             self.interval = self.base_interval
             self.idle_runs = 0
             return
@@ -1519,7 +2411,7 @@ class RundownWatcher:
         self.idle_runs += 1
         if self.idle_runs >= 3 and self.interval < self.max_interval:
             self.interval = min(self.max_interval, self.interval * 2)
-            self.logger.info(f"Sin cambios en {self.name}; intervalo adaptativo sube a {self.interval}s")
+            self.logger.info("Sin cambios en %s; intervalo adaptativo sube a %ss", self.name, self.interval)
 
 
 class ProfileRunner:
@@ -1546,6 +2438,13 @@ class ProfileRunner:
         # Paralelismo configurable por perfil
         self.max_workers = profile_config.get("monitor", {}).get("max_workers", 5)
         self.stagger_seconds = float(profile_config.get("monitor", {}).get("stagger_seconds", 0.5))
+        # Bloque de resultados por consola (en servicio se puede desactivar y quedarse con el log)
+        self.print_results = bool(profile_config.get("monitor", {}).get("print_results", True))
+        # Hilos reutilizados entre pasadas (no se crea un pool nuevo en cada run_once)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, int(self.max_workers)),
+            thread_name_prefix=f"Watcher_{profile_name}"
+        )
         self.ftp_pool = ftp_pool
         
         # ContentManager independiente para este perfil
@@ -1564,13 +2463,20 @@ class ProfileRunner:
         )
         self.last_clean_time = 0
         
-        # Lock para impresión
-        self._print_lock = threading.Lock()
+        # URLs vigentes por watcher y su unión (se recalcula solo si alguna cambia)
+        self._url_sets: Dict[str, frozenset] = {}
+        self._total_urls: frozenset = frozenset()
+        self._urls_dirty = False
+        self._last_synced_urls: Optional[frozenset] = None
     
     def _initialize_watchers(self):
         """Inicializa solo los monitores con active=true."""
         monitors = self.profile_config.get("monitors", [])
-        ap_filter = self.profile_config.get("monitor", {}).get("ap_filter", "")
+        # Valores por defecto del perfil, resueltos una vez para todos los monitores
+        monitor_defaults = self.profile_config.get("monitor", {})
+        ap_filter = monitor_defaults.get("ap_filter", "")
+        debug_parser = monitor_defaults.get("debug_parser", False)
+        state_dir = self.content_manager.download_base
         
         active_count = 0
         inactive_count = 0
@@ -1585,13 +2491,15 @@ class ProfileRunner:
             merged_conf = m_conf.copy()
             if "ap_filter" not in merged_conf:
                 merged_conf["ap_filter"] = ap_filter
+            merged_conf.setdefault("state_dir", state_dir)
+            merged_conf["tipos_validos"] = self.tipos_validos
             if "debug_parser" not in merged_conf:
-                merged_conf["debug_parser"] = self.profile_config.get("monitor", {}).get("debug_parser", False)
+                merged_conf["debug_parser"] = debug_parser
             if "inews_host" not in merged_conf and "host" not in merged_conf and self.ftp_pool.hosts:
                 merged_conf["assigned_inews_host"] = self.ftp_pool.next_host()
             
             # Nombre del watcher incluye el perfil para distinguir en logs
-            watcher_name = f"{self.profile_name}/{name}"
+            watcher_name = sys.intern(f"{self.profile_name}/{name}")
             self.watchers.append(RundownWatcher(watcher_name, merged_conf, self.inews_config, self.ftp_pool))
             active_count += 1
         
@@ -1603,19 +2511,9 @@ class ProfileRunner:
     def _process_watcher(self, watcher: RundownWatcher) -> List[Dict]:
         """Procesa un watcher con los tipos de rótulo de este perfil."""
         try:
-            # Aplicar tipos de rótulo específicos de este perfil
-            # (cada perfil puede tener distintos tipos_rotulo_validos)
-            original_tipos = StoryParser.TIPOS_VALIDOS
-            StoryParser.TIPOS_VALIDOS = self.tipos_validos
-            
-            results = watcher.process()
-            
-            StoryParser.TIPOS_VALIDOS = original_tipos
-            
-            if results:
-                with self._print_lock:
-                    self._print_results(results, watcher.name)
-            return results
+            # Los tipos de rótulo de este perfil llegan al watcher por su config
+            # y se pasan al parser explícitamente (sin tocar StoryParser.TIPOS_VALIDOS)
+            return watcher.process()
         except Exception as e:
             self.logger.error(f"Error procesando watcher {watcher.name}: {e}", exc_info=True)
             return []
@@ -1628,36 +2526,43 @@ class ProfileRunner:
             return []
         
         all_new_results = []
+        printable = []
         any_processed = False
         
-        effective_workers = min(self.max_workers, len(due_watchers))
+        future_to_watcher = {}
+        for idx, watcher in enumerate(due_watchers):
+            if idx > 0 and self.stagger_seconds > 0:
+                time.sleep(self.stagger_seconds)
+            future_to_watcher[self._executor.submit(self._process_watcher, watcher)] = watcher
         
-        with ThreadPoolExecutor(max_workers=effective_workers) as executor:
-            future_to_watcher = {}
-            for idx, watcher in enumerate(due_watchers):
-                if idx > 0 and self.stagger_seconds > 0:
-                    time.sleep(self.stagger_seconds)
-                future_to_watcher[executor.submit(self._process_watcher, watcher)] = watcher
-            
-            for future in as_completed(future_to_watcher):
-                watcher = future_to_watcher[future]
-                try:
-                    results = future.result()
-                    if results:
-                        all_new_results.extend(results)
-                    any_processed = True
-                except Exception as e:
-                    self.logger.error(f"Excepción en watcher {watcher.name}: {e}", exc_info=True)
+        for future in as_completed(future_to_watcher):
+            watcher = future_to_watcher[future]
+            try:
+                results = future.result()
+                if results:
+                    all_new_results.extend(results)
+                    printable.append((watcher.name, results))
+                any_processed = True
+            except Exception as e:
+                self.logger.error(f"Excepción en watcher {watcher.name}: {e}", exc_info=True)
+        
+        # Un único bloque por pasada: las fuentes no se intercalan y hay un solo flush
+        if self.print_results:
+            self._print_results_batch(printable)
         
         if any_processed:
-            # Sincronización de contenido
-            total_urls = set()
-            all_watchers_ready = True
-            
-            for w in self.watchers:
-                total_urls.update(w.active_urls)
-                if not w.has_run:
-                    all_watchers_ready = False
+            # Sincronización de contenido: solo los watchers procesados en esta
+            # pasada pueden haber cambiado sus URLs; la unión se rehace si alguno cambió
+            for w in due_watchers:
+                urls = w.active_urls
+                if self._url_sets.get(w.name) != urls:
+                    self._url_sets[w.name] = urls
+                    self._urls_dirty = True
+            if self._urls_dirty:
+                self._total_urls = frozenset().union(*self._url_sets.values())
+                self._urls_dirty = False
+            total_urls = self._total_urls
+            all_watchers_ready = all(w.has_run for w in self.watchers)
             
             should_clean = False
             current_time = time.time()
@@ -1667,37 +2572,71 @@ class ProfileRunner:
                     should_clean = True
                     self.last_clean_time = current_time
             
-            self.content_manager.sync_content(list(total_urls), clean=should_clean)
+            # Sin cambios netos, sin limpieza y sin descargas pendientes (p.ej. fallidas
+            # que haya que reintentar): sync_content no tendría nada que hacer
+            if (
+                should_clean
+                or total_urls != self._last_synced_urls
+                or self.content_manager.has_pending(total_urls)
+            ):
+                self.content_manager.sync_content(total_urls, clean=should_clean)
+                self._last_synced_urls = total_urls
         
         return all_new_results
     
     def disconnect_all(self):
-        """Desconecta todas las conexiones FTP."""
+        """Desconecta todas las conexiones FTP y libera los hilos del perfil."""
+        self._executor.shutdown(wait=True)
         for w in self.watchers:
             try:
                 w.disconnect()
             except Exception:
                 pass
     
-    def _print_results(self, results, source_name):
+    def _print_results_batch(self, printable):
+        """Escribe los resultados de la pasada agrupados por fuente, en una sola escritura."""
+        if not printable:
+            return
+        lines = []
+        for source_name, results in printable:
+            lines.append("\n" + "="*60)
+            lines.append(f"[{self.display_name}] FUENTE: {source_name} ({len(results)} entradas)")
+            self._format_results(results, lines)
+            lines.append("="*60 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+    
+    @staticmethod
+    def _format_results(results, lines: List[str]):
+        separator = "-"*60
         for result in results:
-            urls = result['info'].get('urls', [])
-            rotulos = result['info'].get('rotulos_filtrados', [])
+            info = result['info']
             
-            print("\n" + "="*60)
-            print(f"[{self.display_name}] FUENTE: {source_name}")
-            print(f"ENTRADA: {result['entry_name']}")
-            print(f"TÍTULO: {result['info']['title']}")
-            print("-"*60)
-            print("RÓTULOS ENCONTRADOS:")
-            for r in rotulos:
-                print(f"  - Canal: {r['canal']}, Tipo: {r['tipo']}")
-                print(f"    Contenido/URL: {r['contenido']}")
-            print("-"*60)
-            print("URLs PARA DESCARGA:")
-            for url in urls:
-                print(f"  → {url}")
-            print("="*60 + "\n")
+            lines.append(separator)
+            lines.append(f"ENTRADA: {result['entry_name']}")
+            lines.append(f"TÍTULO: {info['title']}")
+            lines.append(separator)
+            lines.append("RÓTULOS ENCONTRADOS:")
+            for r in info.get('rotulos_filtrados', []):
+                lines.append(f"  - Canal: {r['canal']}, Tipo: {r['tipo']}")
+                lines.append(f"    Contenido/URL: {r['contenido']}")
+            lines.append(separator)
+            lines.append("URLs PARA DESCARGA:")
+            lines.extend(f"  → {url}" for url in info.get('urls', []))
+
+
+class _ConfigChangeHandler:
+    """Handler de watchdog: avisa al monitor cuando cambia algún .json vigilado."""
+
+    def __init__(self, monitor: "INewsMonitor"):
+        self.monitor = monitor
+
+    def dispatch(self, event):
+        if getattr(event, "is_directory", False):
+            return
+        paths = (getattr(event, "src_path", ""), getattr(event, "dest_path", ""))
+        if any(str(p).lower().endswith(".json") for p in paths if p):
+            self.monitor._on_config_changed()
 
 
 class INewsMonitor:
@@ -1720,6 +2659,13 @@ class INewsMonitor:
         self._config_mtime: Optional[float] = None
         self._profile_mtimes: Dict[str, Optional[float]] = {}
         self._last_reload_check = 0.0
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
+        self._buffered_file_handler: Optional[logging.handlers.MemoryHandler] = None
+        self._log_flush_stop = threading.Event()
+        self._wake = threading.Event()
+        self._profile_executor: Optional[ThreadPoolExecutor] = None
+        self._config_observer = None
+        self._reload_needed = False
 
         self.config = self._load_config(fail_fast=True) or {}
         self._setup_logging()
@@ -1731,20 +2677,26 @@ class INewsMonitor:
         self.profile_runners: List[ProfileRunner] = self._build_profile_runners(
             self.config, self.scripts_twitter_path, self.ftp_pool
         )
+        self._profile_executor = ThreadPoolExecutor(
+            max_workers=max(1, int(self.config.get("max_parallel_profiles", 4))),
+            thread_name_prefix="Profile"
+        )
         self._capture_runtime_fingerprints()
+        self._start_config_observer()
 
     def _load_config(self, fail_fast: bool = True) -> Optional[Dict]:
         last_error = None
         for _ in range(3):
             try:
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                st = os.stat(self.config_path)
+                return _read_json_cached(self.config_path, st.st_mtime_ns, st.st_size)
             except Exception as e:
                 last_error = e
                 time.sleep(0.1)
 
         if fail_fast:
-            print(f"ERROR cargando config: {last_error}")
+            # Aún no hay logging: escritura directa a stderr, sin buffers que se pierdan al salir
+            os.write(2, f"ERROR cargando config: {last_error}\n".encode("utf-8", "replace"))
             sys.exit(1)
 
         logger = logging.getLogger(self.__class__.__name__)
@@ -1814,23 +2766,62 @@ class INewsMonitor:
     
     def _setup_logging(self):
         log_config = self.config.get("logging", {})
-        log_level = getattr(logging, log_config.get("level", "INFO"))
+        log_level = _parse_log_level(log_config.get("level", "INFO"))
         log_file = log_config.get("file", "inews_monitor.log")
         
-        formatter = logging.Formatter(
+        # Un único formatter compartido por fichero y consola
+        formatter = _CachedTimeFormatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s', 
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setFormatter(formatter)
+        file_handler.setLevel(log_level)
         console_handler = logging.StreamHandler()
         console_handler.setFormatter(formatter)
+        console_level = log_config.get("console_level")
+        console_handler.setLevel(_parse_log_level(console_level, log_level) if console_level else log_level)
         
         root = logging.getLogger()
         root.setLevel(log_level)
         if not root.handlers:
-            root.addHandler(file_handler)
-            root.addHandler(console_handler)
+            # Los hilos solo encolan registros; formato y escritura van en el hilo del listener
+            log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+            root.addHandler(logging.handlers.QueueHandler(log_queue))
+            # El fichero se escribe por lotes: al llenarse el buffer, con cada ERROR
+            # o como mucho cada flush_interval_seconds (el panel de control lo lee en vivo)
+            self._buffered_file_handler = logging.handlers.MemoryHandler(
+                capacity=512, flushLevel=logging.ERROR, target=file_handler, flushOnClose=True
+            )
+            self._log_listener = logging.handlers.QueueListener(
+                log_queue, self._buffered_file_handler, console_handler, respect_handler_level=True
+            )
+            self._log_listener.start()
+            flush_interval = float(log_config.get("flush_interval_seconds", 5))
+            threading.Thread(
+                target=self._periodic_log_flush, args=(flush_interval,),
+                name="LogFlush", daemon=True
+            ).start()
+            atexit.register(self._stop_logging)
+
+    def _periodic_log_flush(self, interval: float):
+        """Limita la ventana de pérdida del buffer de log si el proceso muere."""
+        while not self._log_flush_stop.wait(max(1.0, interval)):
+            handler = self._buffered_file_handler
+            if handler is not None:
+                handler.flush()
+    
+    def _stop_logging(self):
+        """Vacía la cola de logging y detiene el listener (idempotente)."""
+        listener = self._log_listener
+        if listener is not None:
+            self._log_listener = None
+            listener.stop()
+        self._log_flush_stop.set()
+        handler = self._buffered_file_handler
+        if handler is not None:
+            self._buffered_file_handler = None
+            handler.close()
     
     def _build_profile_runners(
         self,
@@ -1870,15 +2861,15 @@ class INewsMonitor:
                 continue
 
             try:
-                with open(profile_path, 'r', encoding='utf-8') as f:
-                    profile_config = json.load(f)
+                st = os.stat(profile_path)
+                profile_config = _read_json_cached(profile_path, st.st_mtime_ns, st.st_size)
 
                 runner = ProfileRunner(
                     profile_name, profile_config, inews_config,
                     scripts_twitter_path, self.logger, ftp_pool
                 )
                 runners.append(runner)
-                self.logger.info(f"Perfil cargado: {profile_name} ({runner.display_name})")
+                self.logger.info("Perfil cargado: %s (%s)", profile_name, runner.display_name)
 
             except Exception as e:
                 self.logger.error(f"Error cargando perfil {profile_name}: {e}")
@@ -1904,9 +2895,53 @@ class INewsMonitor:
         self._profile_mtimes = profile_mtimes
         self._last_reload_check = time.time()
 
+    def _start_config_observer(self):
+        """
+        Vigila config.json y la carpeta de perfiles con watchdog si está instalado;
+        si no, la recarga sigue funcionando por sondeo de mtime.
+        """
+        self._stop_config_observer()
+        if _FsObserver is None:
+            return
+        watch_dirs = {
+            os.path.dirname(self.config_path),
+            os.path.abspath(self._resolve_profiles_dir(self.config)),
+        }
+        try:
+            observer = _FsObserver()
+            handler = _ConfigChangeHandler(self)
+            for directory in watch_dirs:
+                if os.path.isdir(directory):
+                    observer.schedule(handler, directory, recursive=False)
+            observer.daemon = True
+            observer.start()
+            self._config_observer = observer
+        except Exception as e:
+            self.logger.warning(f"No se pudo vigilar la config con watchdog (se usa sondeo): {e}")
+            self._config_observer = None
+
+    def _stop_config_observer(self):
+        observer = self._config_observer
+        if observer is not None:
+            self._config_observer = None
+            try:
+                observer.stop()
+            except Exception:
+                pass
+
+    def _on_config_changed(self):
+        """Llamado desde el hilo de watchdog: marca la recarga y despierta el bucle."""
+        self._reload_needed = True
+        self._wake.set()
+
     def _detect_runtime_changes(self) -> Optional[str]:
         now = time.time()
-        if now - self._last_reload_check < self.reload_check_interval:
+        if self._config_observer is not None:
+            # Con watchdog solo se comprueban mtimes cuando llegó un evento
+            if not self._reload_needed:
+                return None
+            self._reload_needed = False
+        elif now - self._last_reload_check < self.reload_check_interval:
             return None
         self._last_reload_check = now
 
@@ -1944,10 +2979,13 @@ class INewsMonitor:
         self.ftp_pool = new_ftp_pool
         self.profile_runners = new_runners
         self._capture_runtime_fingerprints()
+        self._start_config_observer()
 
         for runner in old_runners:
             try:
                 runner.disconnect_all()
+                # Solo los gestores vigentes consolidan el estado al salir
+                runner.content_manager.close()
             except Exception:
                 pass
         try:
@@ -1966,15 +3004,25 @@ class INewsMonitor:
         self._reload_runtime_if_needed()
 
         all_results = []
-        for runner in self.profile_runners:
-            try:
-                results = runner.run_once()
-                if results:
-                    all_results.extend(results)
-            except Exception as e:
-                self.logger.error(f"Error en perfil {runner.profile_name}: {e}", exc_info=True)
+        runners = self.profile_runners
+        if len(runners) <= 1:
+            outcomes = [self._run_profile(r) for r in runners]
+        else:
+            # Los perfiles son independientes: se procesan a la vez (el pool FTP
+            # compartido sigue limitando las sesiones abiertas contra iNews)
+            futures = [self._profile_executor.submit(self._run_profile, r) for r in runners]
+            outcomes = [f.result() for f in futures]
+        for results in outcomes:
+            all_results.extend(results)
         self.ftp_pool.close_idle_connections()
         return all_results
+
+    def _run_profile(self, runner: "ProfileRunner") -> List[Dict]:
+        try:
+            return runner.run_once() or []
+        except Exception as e:
+            self.logger.error(f"Error en perfil {runner.profile_name}: {e}", exc_info=True)
+            return []
     
     def _disconnect_all(self):
         """Desconecta todas las conexiones de todos los perfiles."""
@@ -1985,6 +3033,23 @@ class INewsMonitor:
     def stop(self):
         """Solicita parada limpia del monitor."""
         self.running = False
+        self._wake.set()
+
+    def _seconds_until_next_work(self) -> float:
+        """
+        Tiempo hasta el próximo watcher pendiente, acotado por la revisión de
+        recarga en caliente para no retrasar la detección de cambios de config.
+        """
+        now = time.time()
+        next_due = min(
+            (w.next_due_at for r in self.profile_runners for w in r.watchers),
+            default=now + self.reload_check_interval
+        )
+        if self._config_observer is not None:
+            # watchdog despierta el bucle al cambiar la config
+            return max(0.1, next_due - now)
+        next_reload_check = self._last_reload_check + self.reload_check_interval
+        return max(0.1, min(next_due, next_reload_check) - now)
     
     def run(self):
         self.running = True
@@ -1998,11 +3063,19 @@ class INewsMonitor:
         try:
             while self.running:
                 self.run_once()
-                time.sleep(1)
+                # Dormir hasta que haya trabajo; stop() despierta antes
+                self._wake.wait(self._seconds_until_next_work())
+                self._wake.clear()
         except KeyboardInterrupt:
             self.logger.info("Deteniendo...")
         finally:
+            self._stop_config_observer()
+            self._profile_executor.shutdown(wait=True)
             self._disconnect_all()
+            # Solo el monitor consolida el diario de estado en la instantánea
+            for runner in self.profile_runners:
+                runner.content_manager.close(compact=True)
+            self._stop_logging()
 
 
 def main():
@@ -2011,13 +3084,25 @@ def main():
     parser.add_argument('--once', '-o', action='store_true', help='Ejecutar una vez y salir')
     args = parser.parse_args()
     
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    os.chdir(script_dir)
+    # Las rutas relativas de config.json y de los perfiles son relativas al script
+    if os.getcwd() != SCRIPT_DIR:
+        os.chdir(SCRIPT_DIR)
     
     monitor = INewsMonitor(config_path=args.config)
+    # SIGTERM (servicio) y SIGBREAK (Ctrl+Break / cierre de consola en Windows)
+    # despiertan la espera del bucle al instante vía stop()
+    for sig_name in ("SIGTERM", "SIGBREAK"):
+        sig = getattr(signal, sig_name, None)
+        if sig is None:
+            continue
+        try:
+            signal.signal(sig, lambda signum, frame: monitor.stop())
+        except (ValueError, OSError):
+            pass
     
     if args.once:
         monitor.run_once()
+        monitor._stop_logging()
     else:
         monitor.run()
 
@@ -1,45 +1,114 @@
 import logging
+import queue
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from inews_monitor import INewsMonitor, StoryParser
 
 # Setup basic logging to console
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger("InspectContent")
 
+# Dominios que delatan una URL de red social (se buscan como subcadena)
+URL_DOMAINS = ("x.com", "twitter.com")
+
+# Historias con URL que se muestran antes de parar
+MAX_MATCHES = 5
+# Conexiones simultáneas (incluida la principal) para leer historias
+FETCH_WORKERS = 4
+
+def has_url_domain(text):
+    return any(domain in text for domain in URL_DOMAINS)
+
+def find_matches(pool, connection, host, path, names):
+    """
+    Lee las historias repartiéndolas entre varias conexiones del pool y entrega
+    (nombre, contenido) de las que contienen URLs según van apareciendo.
+    Al llegar a MAX_MATCHES se deja de pedir historias nuevas.
+    """
+    pending = queue.SimpleQueue()
+    for name in names:
+        pending.put(name)
+    matches = queue.SimpleQueue()
+    stop = threading.Event()
+
+    # Cada hilo usa su propia conexión (el canal de control FTP no es thread-safe)
+    leases = []
+    for _ in range(FETCH_WORKERS - 1):
+        lease = pool.try_acquire(host)
+        if lease is None:
+            break
+        leases.append(lease)
+    connections = [connection]
+    for lease in leases:
+        extra = lease.connection
+        if extra.ensure_connected() and extra.navigate_to(path):
+            connections.append(extra)
+
+    def drain(conn):
+        while not stop.is_set():
+            try:
+                name = pending.get_nowait()
+            except queue.Empty:
+                return
+            content = conn.read_story(name)
+            if content and has_url_domain(content):
+                matches.put((name, content))
+
+    try:
+        with ThreadPoolExecutor(max_workers=len(connections)) as executor:
+            futures = [executor.submit(drain, conn) for conn in connections]
+            found = 0
+            while found < MAX_MATCHES:
+                try:
+                    match = matches.get(timeout=0.2)
+                except queue.Empty:
+                    if all(f.done() for f in futures) and matches.empty():
+                        break
+                    continue
+                found += 1
+                yield match
+            stop.set()
+    finally:
+        stop.set()
+        for lease in leases:
+            pool.release(lease.connection)
+
 def inspect_content():
     print("=== Inspecting iNews Content ===")
-    
+
     monitor = INewsMonitor()
-    if not monitor.connection.connect():
-        print("Failed to connect")
+    watchers = [w for runner in monitor.profile_runners for w in runner.watchers]
+    if not watchers:
+        print("No active watchers")
         return
 
     # Use the first watcher path
-    path = monitor.watchers[0].path
+    watcher = watchers[0]
+    path = watcher.path
     print(f"Inspecting path: {path}")
-    
-    if monitor.connection.navigate_to(path):
-        entries = monitor.connection.list_entries()
-        print(f"Found {len(entries)} entries. Searching for 'x.com' or 'twitter.com'...")
-        
-        found_count = 0
-        for entry in entries:
-            name = entry.get("name")
-            if not name or name.startswith('.'): continue
-            
-            # Read content
-            content = monitor.connection.read_story(name)
-            if not content: continue
-
-            # Check for URL indicators
-            if "x.com" in content or "twitter.com" in content:
+
+    try:
+        with monitor.ftp_pool.acquire(watcher.assigned_host) as connection:
+            if not connection.ensure_connected():
+                print("Failed to connect")
+                return
+            if not connection.navigate_to(path):
+                print(f"Failed to navigate to {path}")
+                return
+
+            names = [name for name in connection.list_story_names(path) if name and not name.startswith('.')]
+            print(f"Found {len(names)} entries. Searching for {' or '.join(repr(d) for d in URL_DOMAINS)}...")
+
+            found_count = 0
+            for name, content in find_matches(monitor.ftp_pool, connection, watcher.assigned_host, path, names):
                 found_count += 1
                 print(f"\n--- MATCH FOUND: {name} ---")
-                
+
                 ap_tags = StoryParser.extract_ap_tags(content)
                 print(f"  AP Tags with URL:")
                 for ap in ap_tags:
-                    if "x.com" in ap or "twitter.com" in ap:
+                    if has_url_domain(ap):
                         print(f"    Raw: {ap}")
                         # Try to parse it to see what type it detects
                         r = StoryParser.parse_rotulo_from_ap(ap)
@@ -47,13 +116,12 @@ def inspect_content():
                             print(f"    Parsed -> Type: '{r.tipo}', Content: '{r.contenido}'")
                         else:
                             print(f"    Parsed -> FAILED")
-                
-            if found_count >= 5: break
-            
-        if found_count == 0:
-            print("No entries found containing x.com or twitter.com")
 
-    monitor.connection.disconnect()
+            if found_count == 0:
+                print("No entries found containing x.com or twitter.com")
+    finally:
+        monitor._disconnect_all()
+        monitor._stop_logging()
 
 if __name__ == "__main__":
     inspect_content()
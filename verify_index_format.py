@@ -1,97 +1,107 @@
 import os
-import json
-import logging
+import sys
 import csv
+import logging
+import argparse
+import tempfile
 from inews_monitor import ContentManager
 
 # Dummy Logger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("VerifyIndex")
 
-# Mock Config
-config = {
-    "content": {
-        "download_base_path": "\\\\172.28.142.62\\CAMIO4\\TwitterPrime", 
-        "scripts_twitter_path": "C:\\TrabajosPRIME\\AppTuitsDoble\\ScriptsTwitter"
+# Share real (solo si se pide con --share)
+SHARE_PATH = "\\\\172.28.142.62\\CAMIO4\\TwitterPrime"
+SCRIPTS_TWITTER_PATH = "C:\\TrabajosPRIME\\AppTuitsDoble\\ScriptsTwitter"
+
+TEST_URL = "https://x.com/Yolanda_Diaz_/status/1880677589356020087"
+TEST_ID = "1880677589356020087"
+
+def check_index_file(index_file, expected_id=None):
+    """
+    Lee index.csv y comprueba que las rutas apuntan a carpetas, no a tweet_api.json.
+    Con expected_id se exige además que la primera fila sea la de ese tweet.
+    """
+    if not os.path.exists(index_file):
+        print(f"[X] index.csv NOT found at {index_file}")
+        return False
+
+    print(f"[OK] index.csv found at {index_file}")
+    with open(index_file, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter=";")
+        headers = next(reader, None)
+        print(f"Headers: {headers}")
+        rows = list(reader)
+
+    if not rows:
+        print("[X] CSV is empty!")
+        return False
+
+    for row in rows:
+        if len(row) < 2:
+            print(f"[X] Row has less than 2 columns: {row}")
+            return False
+        if row[1].endswith("tweet_api.json"):
+            print(f"[X] FAILED: Path still points to json file: {row[1]}")
+            return False
+
+    path_in_csv = rows[0][1]
+    print(f"Row: {rows[0]}")
+    print(f"Path in CSV: {path_in_csv}")
+    if expected_id is not None and not path_in_csv.rstrip("\\/").endswith(expected_id):
+        print(f"[?] WARNING: Unexpected path {path_in_csv}")
+        return False
+    print(f"[OK] SUCCEEDED: {len(rows)} paths point to folders")
+    return True
+
+def verify_index_format(download_base):
+    """
+    Genera index.csv en download_base (carpeta temporal local) y comprueba su formato.
+    Se crea la carpeta del tweet y su tweet_api.json, así que no hace falta red
+    ni parchear os.path.exists.
+    """
+    print(f"=== Verifying Index Format ({download_base}) ===")
+
+    config = {
+        "content": {
+            "download_base_path": download_base,
+            "scripts_twitter_path": SCRIPTS_TWITTER_PATH
+        }
     }
-}
 
-def verify_index_format():
-    print("=== Verifying Index Format ===")
-    
     # 1. Initialize ContentManager
     cm = ContentManager(config, logger)
-    
+
+    target_dir = os.path.join(cm.download_base, TEST_ID)
+    os.makedirs(target_dir, exist_ok=True)
+    with open(os.path.join(target_dir, "tweet_api.json"), "w", encoding="utf-8") as f:
+        f.write("{}")
+
     # 2. Mock State (Simulate a downloaded tweet)
-    test_url = "https://x.com/Yolanda_Diaz_/status/1880677589356020087"
-    test_id = "1880677589356020087"
-    
-    print(f"Injecting state: {test_url} -> {test_id}")
-    cm.state[test_url] = test_id
-    
-    # Ensure the directory exists effectively for the test to pass 'os.path.exists' checks in _update_index
-    target_dir = os.path.join(cm.download_base, test_id)
-    target_json = os.path.join(target_dir, "tweet_api.json")
-    
-    # We need to ensure checks pass, but we can't easily write to network path if auth is needed
-    # Ideally checking existence. If it doesn't exist, we skip writing to CSV, so we can't verify format.
-    # Assuming user has access or we can just mock os.path.exists
-    
-    original_exists = os.path.exists
-    def mock_exists(path):
-        if path == target_json:
-            return True
-        return original_exists(path)
-    
-    os.path.exists = mock_exists
-    print("MOCKED os.path.exists for target JSON")
+    print(f"Injecting state: {TEST_URL} -> {TEST_ID}")
+    cm.state[TEST_URL] = TEST_ID
 
     # 3. Trigger Update Index
     print("Running _update_index...")
-    try:
-        cm._update_index()
-    except Exception as e:
-        print(f"Error updating index: {e}")
-    finally:
-        os.path.exists = original_exists # Restore
+    cm._update_index()
 
     # 4. Read Result
-    index_file = os.path.join(cm.download_base, "index.csv")
-    if os.path.exists(index_file):
-        print(f"[OK] index.csv created at {index_file}")
-        with open(index_file, "r") as f:
-            reader = csv.reader(f, delimiter=";")
-            headers = next(reader)
-            print(f"Headers: {headers}")
-            
-            t = list(reader)
-            if not t:
-                print("[X] CSV is empty!")
-                return
-
-            row = t[0]
-            print(f"Row: {row}")
-            if len(row) < 2:
-                 print("[X] Row has less than 2 columns")
-                 return
-                 
-            path_in_csv = row[1]
-            print(f"Path in CSV: {path_in_csv}")
-            
-            if path_in_csv.endswith("tweet_api.json"):
-                print("[X] FAILED: Path still points to json file")
-            elif path_in_csv.endswith(test_id) or path_in_csv.endswith(test_id + os.sep) or path_in_csv.endswith(test_id + "\\"):
-                 print("[OK] SUCCEEDED: Path points to folder")
-            else:
-                 # Check if it is a folder path (no extension)
-                 _, ext = os.path.splitext(path_in_csv)
-                 if not ext:
-                     print("[OK] SUCCEEDED: Path appears to be a folder (no extension)")
-                 else:
-                     print(f"[?] WARNING: Path ends with {ext}")
+    return check_index_file(os.path.join(cm.download_base, "index.csv"), TEST_ID)
+
+def main():
+    parser = argparse.ArgumentParser(description="Verifica la generación y el formato de index.csv")
+    parser.add_argument("--share", action="store_true",
+                        help=f"Solo leer y validar el index.csv existente en el share real ({SHARE_PATH})")
+    args = parser.parse_args()
 
+    if args.share:
+        # Solo lectura: no se toca el estado ni se regenera el índice de producción
+        print(f"=== Checking existing index ({SHARE_PATH}) ===")
+        ok = check_index_file(os.path.join(SHARE_PATH, "index.csv"))
     else:
-        print("[X] index.csv NOT created")
+        with tempfile.TemporaryDirectory(prefix="TwitterPrime_") as download_base:
+            ok = verify_index_format(download_base)
+    sys.exit(0 if ok else 1)
 
 if __name__ == "__main__":
-    verify_index_format()
+    main()